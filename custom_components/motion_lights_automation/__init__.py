@@ -138,8 +138,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Store coordinator in runtime_data
     entry.runtime_data = motion_coordinator
 
-    # Set up event listeners
+    # Set up event listeners; they are torn down whenever the entry unloads
     await motion_coordinator.async_setup_listeners()
+    entry.async_on_unload(motion_coordinator.async_cleanup_listeners)
 
     # Forward setup to platforms
     await hass.config_entries.async_forward_entry_setups(entry, _PLATFORMS)
@@ -175,10 +176,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    # Clean up coordinator (only if it was set up)
-    if hasattr(entry, "runtime_data") and entry.runtime_data:
-        coordinator = entry.runtime_data
-        coordinator.async_cleanup_listeners()
+    # Coordinator listeners are cleaned up by the async_on_unload callback
 
     # Remove service if this was the last entry
     if (
@@ -37,6 +37,7 @@ from .const import (
     DEFAULT_NO_MOTION_WAIT,
     DOMAIN,
 )
+from .util import as_list
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -51,17 +52,8 @@ def get_user_schema(data: dict[str, Any] | None = None) -> vol.Schema:
         data: Existing configuration data to use as defaults
     """
 
-    def _as_list(value: Any) -> list[str]:
-        if value is None:
-            return []
-        if isinstance(value, str):
-            return [value]
-        if isinstance(value, (list, tuple, set)):
-            return [str(v) for v in value]
-        return []
-
-    motion_default = _as_list(data.get(CONF_MOTION_ENTITY)) if data else []
-    lights_default = _as_list(data.get(CONF_LIGHTS)) if data else []
+    motion_default = as_list(data.get(CONF_MOTION_ENTITY)) if data else []
+    lights_default = as_list(data.get(CONF_LIGHTS)) if data else []
 
     schema_dict: dict[Any, Any] = {}
 
@@ -205,29 +197,19 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     Data has the keys from STEP_USER_DATA_SCHEMA with values provided by the user.
     """
 
-    # Helper to normalize a config value into a list of entity_ids
-    def _as_list(value: Any) -> list[str]:
-        if value is None:
-            return []
-        if isinstance(value, str):
-            return [value]
-        if isinstance(value, (list, tuple, set)):
-            return [str(v) for v in value]
-        return []
-
     # Validate provided lights (optional; only validate if user set them)
-    for ent in _as_list(data.get(CONF_LIGHTS)):
+    for ent in as_list(data.get(CONF_LIGHTS)):
         if not hass.states.get(ent):
             raise CannotConnect(f"Light entity {ent} not found")
 
     # Validate provided motion sensors (optional)
-    for ent in _as_list(data.get(CONF_MOTION_ENTITY)):
+    for ent in as_list(data.get(CONF_MOTION_ENTITY)):
         if not hass.states.get(ent):
             raise CannotConnect(f"Motion entity {ent} not found")
 
     # Validate override switch if provided (accept single or list defensively)
     override_val = data.get(CONF_OVERRIDE_SWITCH)
-    for ov in _as_list(override_val):
+    for ov in as_list(override_val):
         if not hass.states.get(ov):
             raise CannotConnect(f"Override switch {ov} not found")
 
@@ -286,17 +268,8 @@ class ConfigFlow(ConfigFlow, domain=DOMAIN):
             config_data = {**self._basic_config, **user_input}
 
             # Create unique ID based on lights and motion entities
-            def _normalize_list(val: Any) -> list[str]:
-                if val is None:
-                    return []
-                if isinstance(val, str):
-                    return [val]
-                if isinstance(val, (list, tuple, set)):
-                    return [str(v) for v in val]
-                return []
-
-            lights_list = sorted(_normalize_list(config_data.get(CONF_LIGHTS)))
-            motion_list = sorted(_normalize_list(config_data.get(CONF_MOTION_ENTITY)))
+            lights_list = sorted(as_list(config_data.get(CONF_LIGHTS)))
+            motion_list = sorted(as_list(config_data.get(CONF_MOTION_ENTITY)))
             name = config_data.get(CONF_NAME) or DOMAIN
 
             # Include lights in unique ID to prevent same lights in multiple instances
@@ -363,17 +336,8 @@ class ConfigFlow(ConfigFlow, domain=DOMAIN):
             # Check if the lights or motion entity changed - if so, update unique ID
             old_unique_id = config_entry.unique_id
 
-            def _normalize_list(val: Any) -> list[str]:
-                if val is None:
-                    return []
-                if isinstance(val, str):
-                    return [val]
-                if isinstance(val, (list, tuple, set)):
-                    return [str(v) for v in val]
-                return []
-
-            lights_list = sorted(_normalize_list(config_data.get(CONF_LIGHTS)))
-            motion_list = sorted(_normalize_list(config_data.get(CONF_MOTION_ENTITY)))
+            lights_list = sorted(as_list(config_data.get(CONF_LIGHTS)))
+            motion_list = sorted(as_list(config_data.get(CONF_MOTION_ENTITY)))
             name = config_data.get(CONF_NAME) or DOMAIN
 
             lights_key = "|".join(lights_list) if lights_list else "no-lights"
@@ -9,6 +9,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
@@ -66,11 +67,11 @@ class BrightnessStrategy(ABC):
     """
 
     @abstractmethod
-    def get_brightness(self, context: dict[str, Any]) -> int:
+    def get_brightness(self, context: Mapping[str, Any]) -> int:
         """Get the target brightness percentage (0-100).
 
         Args:
-            context: Dictionary containing contextual information like:
+            context: Mapping containing contextual information like:
                 - is_dark_inside: bool
                 - ambient_light_level: int
                 - room_occupancy: int
@@ -90,7 +91,7 @@ class TimeOfDayBrightnessStrategy(BrightnessStrategy):
         self.active_brightness = active_brightness
         self.inactive_brightness = inactive_brightness
 
-    def get_brightness(self, context: dict[str, Any]) -> int:
+    def get_brightness(self, context: Mapping[str, Any]) -> int:
         """Get brightness based on ambient light and house activity level.
 
         Returns:
@@ -185,7 +186,7 @@ class LightController:
             if state:
                 self.update_light_state(light_id, state)
 
-    async def turn_on_auto_lights(self, context_data: dict[str, Any]) -> list[str]:
+    async def turn_on_auto_lights(self, context_data: Mapping[str, Any]) -> list[str]:
         """Turn on lights automatically based on brightness strategy.
 
         Args:
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import logging
+from collections import deque
+from collections.abc import Mapping
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, State, callback
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
@@ -52,9 +55,13 @@ from .light_controller import (
 from .manual_detection import BrightnessThresholdStrategy, ManualInterventionDetector
 from .timer_manager import TimerManager, TimerType
 from .triggers import MotionTrigger, OverrideTrigger, TriggerManager
+from .util import as_list
 
 _LOGGER = logging.getLogger(__name__)
 
+# Non-lux ambient sensor states that mean low ambient light (dark inside)
+_DARK_AMBIENT_STATES = frozenset({"on", "true", "True", "1"})
+
 
 class MotionLightsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Motion Lights coordinator using modular architecture.
@@ -109,14 +116,14 @@ class MotionLightsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.data = {}
 
         # Event tracking for diagnostics
-        self._events: list[dict[str, Any]] = []
         self._max_events = 100
+        self._events: deque[dict[str, Any]] = deque(maxlen=self._max_events)
         self._last_transition_reason: str | None = None
         self._last_transition_time: datetime | None = None
 
         # Human-readable event log
-        self._event_log: list[str] = []
         self._max_log_entries = 10
+        self._event_log: deque[str] = deque(maxlen=self._max_log_entries)
         self._last_event_message: str = "Initialized"
 
         # Startup grace period to avoid false manual intervention detection
@@ -140,15 +147,6 @@ class MotionLightsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Load configuration."""
         data = self.config_entry.data
 
-        def _as_list(value: Any) -> list[str]:
-            if value is None:
-                return []
-            if isinstance(value, str):
-                return [value]
-            if isinstance(value, (list, tuple, set)):
-                return [str(v) for v in value]
-            return []
-
         # Motion activation
         self.motion_activation = data.get(
             CONF_MOTION_ACTIVATION, DEFAULT_MOTION_ACTIVATION
@@ -160,7 +158,7 @@ class MotionLightsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         )
 
         # Entities
-        self.motion_entities = _as_list(data.get(CONF_MOTION_ENTITY))
+        self.motion_entities = as_list(data.get(CONF_MOTION_ENTITY))
         override_cfg = data.get(CONF_OVERRIDE_SWITCH)
         if isinstance(override_cfg, (list, tuple, set)):
             override_list = [str(v) for v in override_cfg if v]
@@ -197,8 +195,12 @@ class MotionLightsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Brightness mode state for hysteresis (starts as None, determined on first check)
         self._brightness_mode_is_dim: bool | None = None
 
+        # Last context handed to strategies and the inputs it was built from
+        self._context: Mapping[str, Any] = MappingProxyType({})
+        self._last_context_fingerprint: tuple | None = None
+
         # Lights
-        self._lights = _as_list(data.get(CONF_LIGHTS))
+        self._lights = as_list(data.get(CONF_LIGHTS))
 
     @property
     def _entry_log_name(self) -> str:
@@ -748,6 +750,12 @@ class MotionLightsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             if not new_state or not old_state:
                 return
 
+            # Attribute-only update (same reading, same unit): darkness can't change
+            if new_state.state == old_state.state and new_state.attributes.get(
+                "unit_of_measurement"
+            ) == old_state.attributes.get("unit_of_measurement"):
+                return
+
             # Get context to evaluate current ambient conditions
             context = self._get_context()
             is_dark_now = context.get("is_dark_inside", True)
@@ -905,7 +913,7 @@ class MotionLightsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 return True
         else:
             # Binary representation
-            return state.state in ("on", "true", "True", "1")
+            return state.state in _DARK_AMBIENT_STATES
 
     # ========================================================================
     # State Entry Callbacks
@@ -1084,31 +1092,73 @@ class MotionLightsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         await self.light_controller.turn_off_lights()
         self._update_data()
 
-    def _get_context(self):
-        """Get context for strategies."""
+    def _context_fingerprint(
+        self,
+        house_state: State | None,
+        sensor_state: State | None,
+        motion_active: bool,
+    ) -> tuple:
+        """Return the inputs a strategy context is built from.
+
+        State objects are replaced on every update, so identity is enough to
+        spot a change.
+        """
+        return (
+            house_state,
+            sensor_state,
+            self._brightness_mode_is_dim,
+            motion_active,
+            self.state_machine.current_state,
+        )
+
+    def _get_context(self) -> Mapping[str, Any]:
+        """Get a read-only context for strategies.
+
+        The context is shared between callers and reused while none of its
+        inputs changed since the last call. A context built while logging a
+        warning is not cached, so the warning repeats on every call.
+        """
+        house_state = (
+            self.hass.states.get(self.house_active) if self.house_active else None
+        )
+        sensor_state = (
+            self.hass.states.get(self.ambient_light_sensor)
+            if self.ambient_light_sensor
+            else None
+        )
+        motion_trigger = self.trigger_manager.get_trigger("motion")
+        motion_active = motion_trigger.is_active() if motion_trigger else False
+
+        if (
+            self._context_fingerprint(house_state, sensor_state, motion_active)
+            == self._last_context_fingerprint
+        ):
+            return self._context
+
         is_house_active = True
         is_dark_inside = True
+        cacheable = True
 
         # Get switch states
         if self.house_active:
-            house_state = self.hass.states.get(self.house_active)
             if house_state is None:
                 _LOGGER.warning(
                     "house_active entity '%s' not found; assuming house is active",
                     self.house_active,
                 )
+                cacheable = False
             else:
                 is_house_active = house_state.state == "on"
 
         # Ambient light sensor with hysteresis support
         if self.ambient_light_sensor:
-            sensor_state = self.hass.states.get(self.ambient_light_sensor)
             if sensor_state is None:
                 _LOGGER.warning(
                     "ambient_light_sensor entity '%s' not found; assuming low ambient light",
                     self.ambient_light_sensor,
                 )
                 is_dark_inside = True
+                cacheable = False
             else:
                 # Check if it's a lux sensor (numeric) or binary representation
                 unit = sensor_state.attributes.get("unit_of_measurement")
@@ -1125,23 +1175,30 @@ class MotionLightsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                             self.ambient_light_sensor,
                         )
                         is_dark_inside = True
+                        cacheable = False
                 else:
                     # Any other sensor - treat as binary representation
                     # ON state means low ambient light (dark inside)
                     # For binary_sensor, switch, input_boolean, etc.
-                    is_dark_inside = sensor_state.state in ("on", "true", "True", "1")
-
-        motion_trigger = self.trigger_manager.get_trigger("motion")
-        motion_active = motion_trigger.is_active() if motion_trigger else False
+                    is_dark_inside = sensor_state.state in _DARK_AMBIENT_STATES
 
         # Return dict-like context that strategies can use
-        return {
-            "is_dark_inside": is_dark_inside,
-            "is_house_active": is_house_active,
-            "motion_active": motion_active,
-            "current_state": self.state_machine.current_state,
-            "all_lights": self.light_controller.get_all_lights(),
-        }
+        self._context = MappingProxyType(
+            {
+                "is_dark_inside": is_dark_inside,
+                "is_house_active": is_house_active,
+                "motion_active": motion_active,
+                "current_state": self.state_machine.current_state,
+                "all_lights": tuple(self.light_controller.get_all_lights()),
+            }
+        )
+        # Taken after evaluation, so the updated hysteresis mode is part of the key
+        self._last_context_fingerprint = (
+            self._context_fingerprint(house_state, sensor_state, motion_active)
+            if cacheable
+            else None
+        )
+        return self._context
 
     def _evaluate_lux_with_hysteresis(self, current_lux: float) -> bool:
         """Evaluate lux level with hysteresis to prevent flickering.
@@ -1340,11 +1397,7 @@ class MotionLightsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "type": event_type,
             **details,
         }
-        self._events.append(event)
-
-        # Keep only last N events
-        if len(self._events) > self._max_events:
-            self._events.pop(0)
+        self._events.append(event)  # deque drops the oldest past maxlen
 
         _LOGGER.debug("Event logged: %s - %s", event_type, details)
 
@@ -1352,11 +1405,7 @@ class MotionLightsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Log a human-readable event message."""
         timestamp = dt_util.now().strftime("%H:%M:%S")
         log_entry = f"{timestamp} - {message}"
-        self._event_log.append(log_entry)
-
-        # Keep only last N entries
-        if len(self._event_log) > self._max_log_entries:
-            self._event_log.pop(0)
+        self._event_log.append(log_entry)  # deque drops the oldest past maxlen
 
         # Update last event message for sensor state
         self._last_event_message = message
@@ -90,10 +90,13 @@ class MotionLightsDiagnosticSensor(SensorEntity):
         }
 
         self._remove_listener: Callable[[], None] | None = None
+        # One snapshot per state write, shared by native_value and attributes
+        self._diagnostic_data: dict[str, Any] = {}
 
     async def async_added_to_hass(self) -> None:
         """Register listener when entity is added to Home Assistant."""
         await super().async_added_to_hass()
+        self._refresh_diagnostic_data()
         self._remove_listener = self._coordinator.async_add_listener(
             self._handle_coordinator_update
         )
@@ -105,21 +108,30 @@ class MotionLightsDiagnosticSensor(SensorEntity):
             self._remove_listener = None
         await super().async_will_remove_from_hass()
 
+    @callback
+    def _refresh_diagnostic_data(self) -> None:
+        """Take a fresh snapshot of the coordinator's diagnostic data."""
+        self._diagnostic_data = self._coordinator.get_diagnostic_data()
+
+    async def async_update(self) -> None:
+        """Refresh the snapshot before a polled state write."""
+        self._refresh_diagnostic_data()
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Write state when coordinator updates."""
+        self._refresh_diagnostic_data()
         self.async_write_ha_state()
 
     @property
     def native_value(self) -> str:
         """Return last event message as the sensor state."""
-        diagnostic_data = self._coordinator.get_diagnostic_data()
-        return diagnostic_data.get("last_event_message", "Unknown")
+        return self._diagnostic_data.get("last_event_message", "Unknown")
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return diagnostic data with event history and internal state."""
-        diagnostic_data = self._coordinator.get_diagnostic_data()
+        diagnostic_data = self._diagnostic_data
 
         # Format timer information for display
         timers = diagnostic_data.get("timers", {})
@@ -0,0 +1,16 @@
+"""Shared helpers for motion lights automation."""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+def as_list(value: Any) -> list[str]:
+    """Normalize a config value into a list of entity_ids."""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, (list, tuple, set)):
+        return [str(v) for v in value]
+    return []
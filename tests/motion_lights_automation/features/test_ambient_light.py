@@ -11,12 +11,13 @@ Tests cover:
 from __future__ import annotations
 
 import logging
-from unittest.mock import AsyncMock, patch
+from types import MappingProxyType
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME, STATE_OFF, STATE_ON
 from homeassistant.core import HomeAssistant
+from homeassistant.util.read_only_dict import ReadOnlyDict
 
 from custom_components.motion_lights_automation.const import (
     CONF_AMBIENT_LIGHT_SENSOR,
@@ -28,7 +29,6 @@ from custom_components.motion_lights_automation.const import (
     CONF_LIGHTS,
     CONF_MOTION_ACTIVATION,
     CONF_MOTION_ENTITY,
-    DOMAIN,
 )
 from custom_components.motion_lights_automation.state_machine import (
     STATE_IDLE,
@@ -43,379 +43,271 @@ from custom_components.motion_lights_automation.motion_coordinator import (
 )
 
 
-# =============================================================================
-# Fixtures
-# =============================================================================
+# (name, threshold, [(lux, expected is_dark_inside, expected dim mode), ...]);
+# lux may be non-numeric. threshold 50: LOW=30, HIGH=70; threshold 100: LOW=80, HIGH=120
+HYSTERESIS_CASES = [
+    ("below_low", 50, [(20, True, True)]),
+    ("above_high", 50, [(100, False, False)]),
+    (
+        "deadzone_from_dim",
+        50,
+        [(20, True, True), (50, True, True), (65, True, True), (75, False, False)],
+    ),
+    (
+        "deadzone_from_bright",
+        50,
+        [(100, False, False), (50, False, False), (35, False, False), (25, True, True)],
+    ),
+    (
+        "cloud_flicker",
+        50,
+        [
+            (80, False, False),
+            (45, False, False),
+            (60, False, False),
+            (40, False, False),
+        ],
+    ),
+    # An unparsable reading falls back to dark without setting a mode
+    ("invalid_fallback", 50, [("unknown", True, None)]),
+    (
+        "custom_threshold",
+        100,
+        [(50, True, True), (90, True, True), (125, False, False)],
+    ),
+]
+
+
+# Entry data, merged over the package conftest base by make_coordinator
+_AMBIENT_DATA = MappingProxyType(
+    {
+        CONF_NAME: "Test Room",
+        CONF_LIGHTS: ("light.test",),
+        CONF_AMBIENT_LIGHT_SENSOR: "binary_sensor.ambient_light",
+        CONF_MOTION_ACTIVATION: True,
+        CONF_BRIGHTNESS_ACTIVE: 80,
+        CONF_BRIGHTNESS_INACTIVE: 10,
+        CONF_EXTENDED_TIMEOUT: 1200,
+    }
+)
 
+_LUX_DATA = MappingProxyType(
+    {
+        CONF_LIGHTS: ("light.test",),
+        CONF_AMBIENT_LIGHT_SENSOR: "sensor.illuminance",
+        CONF_AMBIENT_LIGHT_THRESHOLD: 50,  # LOW=30, HIGH=70
+        CONF_BRIGHTNESS_ACTIVE: 80,
+        CONF_BRIGHTNESS_INACTIVE: 10,
+        CONF_EXTENDED_TIMEOUT: 1200,
+    }
+)
 
-@pytest.fixture
-def basic_ambient_entry(hass):
-    """Create a config entry with binary ambient sensor."""
-    return ConfigEntry(
-        version=1,
-        minor_version=1,
-        domain=DOMAIN,
-        title="Test Ambient Light",
-        data={
-            CONF_NAME: "Test Room",
-            CONF_MOTION_ENTITY: ["binary_sensor.motion"],
-            CONF_LIGHTS: ["light.test"],
-            CONF_AMBIENT_LIGHT_SENSOR: "binary_sensor.ambient_light",
-            CONF_MOTION_ACTIVATION: True,
-            CONF_BRIGHTNESS_ACTIVE: 80,
-            CONF_BRIGHTNESS_INACTIVE: 10,
-            CONF_EXTENDED_TIMEOUT: 1200,
-        },
-        options={},
-        entry_id="test_ambient_entry",
-        source="user",
-        unique_id="test_ambient_unique",
-        discovery_keys={},
-    )
+_NO_AMBIENT_DATA = MappingProxyType(
+    {
+        CONF_LIGHTS: ("light.test",),
+        CONF_BRIGHTNESS_ACTIVE: 80,
+        CONF_BRIGHTNESS_INACTIVE: 10,
+        CONF_EXTENDED_TIMEOUT: 1200,
+    }
+)
 
+# Dark binary ambient + house switch
+_HOUSE_ACTIVE_DATA = MappingProxyType(
+    {
+        CONF_NAME: "Test Room",
+        CONF_MOTION_ENTITY: ("binary_sensor.motion",),
+        CONF_LIGHTS: ("light.test",),
+        CONF_AMBIENT_LIGHT_SENSOR: "binary_sensor.ambient",
+        CONF_HOUSE_ACTIVE: "input_boolean.house_active",
+        CONF_MOTION_ACTIVATION: True,
+    }
+)
 
-@pytest.fixture
-def lux_sensor_entry(hass):
-    """Create a config entry with lux sensor."""
-    return ConfigEntry(
-        version=1,
-        minor_version=1,
-        domain=DOMAIN,
-        title="Test Lux Sensor",
-        data={
-            CONF_MOTION_ENTITY: ["binary_sensor.motion"],
-            CONF_LIGHTS: ["light.test"],
-            CONF_AMBIENT_LIGHT_SENSOR: "sensor.illuminance",
-            CONF_AMBIENT_LIGHT_THRESHOLD: 50,  # LOW=30, HIGH=70
-            CONF_BRIGHTNESS_ACTIVE: 80,
-            CONF_BRIGHTNESS_INACTIVE: 10,
-            CONF_EXTENDED_TIMEOUT: 1200,
-        },
-        options={},
-        entry_id="test_lux_entry",
-        source="user",
-        unique_id="test_lux_unique",
-        discovery_keys={},
-    )
 
+# Shared lux sensor attributes; State keeps a ReadOnlyDict as-is instead of copying
+_LUX_ATTRS = ReadOnlyDict({"unit_of_measurement": "lx"})
 
-# =============================================================================
-# Binary Sensor Tests
-# =============================================================================
 
+def _set_lux(hass: HomeAssistant, lux: str | int) -> None:
+    """Report a new illuminance reading."""
+    hass.states.async_set("sensor.illuminance", str(lux), _LUX_ATTRS)
 
-class TestBinarySensorBehavior:
-    """Tests for binary ambient light sensor behavior."""
 
-    async def test_binary_sensor_on_indicates_dark(
-        self, hass: HomeAssistant, basic_ambient_entry
-    ):
-        """Test that binary sensor ON indicates dark (allows light activation)."""
-        hass.states.async_set("binary_sensor.motion", "off")
-        hass.states.async_set("light.test", "off")
-        hass.states.async_set("binary_sensor.ambient_light", "on")
-
-        coordinator = MotionLightsCoordinator(hass, basic_ambient_entry)
-        await coordinator.async_setup_listeners()
-
-        try:
-            context = coordinator._get_context()
-            assert context["is_dark_inside"] is True
+def _is_dark(coordinator: MotionLightsCoordinator) -> bool:
+    """Return the coordinator's current is_dark_inside evaluation."""
+    return coordinator._get_context()["is_dark_inside"]
 
-            strategy = TimeOfDayBrightnessStrategy(
-                active_brightness=80, inactive_brightness=10
-            )
-            brightness = strategy.get_brightness(context)
-            assert brightness == 80
-        finally:
-            coordinator.async_cleanup_listeners()
-
-    async def test_binary_sensor_off_indicates_bright(
-        self, hass: HomeAssistant, basic_ambient_entry
-    ):
-        """Test that binary sensor OFF indicates bright (prevents activation)."""
-        hass.states.async_set("binary_sensor.motion", "off")
-        hass.states.async_set("light.test", "off")
-        hass.states.async_set("binary_sensor.ambient_light", "off")
 
-        coordinator = MotionLightsCoordinator(hass, basic_ambient_entry)
-        await coordinator.async_setup_listeners()
+# =============================================================================
+# Fixtures
+# =============================================================================
 
-        try:
-            context = coordinator._get_context()
-            assert context["is_dark_inside"] is False
 
-            strategy = TimeOfDayBrightnessStrategy(
-                active_brightness=80, inactive_brightness=10
-            )
-            brightness = strategy.get_brightness(context)
-            assert brightness == 0
-        finally:
-            coordinator.async_cleanup_listeners()
+@pytest.fixture(scope="module")
+def strategy_80_10():
+    """Return the shared 80%/10% time-of-day brightness strategy."""
+    return TimeOfDayBrightnessStrategy(active_brightness=80, inactive_brightness=10)
 
-    async def test_binary_sensor_off_prevents_light_activation(
-        self, hass: HomeAssistant, basic_ambient_entry
-    ):
-        """Test that motion with bright ambient doesn't effectively turn on lights."""
-        hass.states.async_set("binary_sensor.motion", "off")
-        hass.states.async_set("light.test", "off")
-        hass.states.async_set("binary_sensor.ambient_light", "off")
 
-        coordinator = MotionLightsCoordinator(hass, basic_ambient_entry)
-        await coordinator.async_setup_listeners()
-
-        try:
-            assert coordinator.current_state == STATE_IDLE
+@pytest.fixture
+def mock_light_controller(monkeypatch: pytest.MonkeyPatch):
+    """Return a helper that swaps a light controller method for an AsyncMock."""
 
-            # Trigger motion
-            hass.states.async_set("binary_sensor.motion", "on")
-            await hass.async_block_till_done()
+    def _apply(coordinator: MotionLightsCoordinator, name: str) -> AsyncMock:
+        mock = AsyncMock()
+        monkeypatch.setattr(coordinator.light_controller, name, mock)
+        return mock
 
-            # Brightness is 0, so motion returns to standby with lights off.
-            assert coordinator.current_state == STATE_IDLE
-            context = coordinator._get_context()
-            brightness = (
-                coordinator.light_controller._brightness_strategy.get_brightness(
-                    context
-                )
-            )
-            assert brightness == 0
-        finally:
-            coordinator.async_cleanup_listeners()
+    return _apply
 
 
 # =============================================================================
-# Lux Sensor Tests
+# Binary Sensor Tests
 # =============================================================================
 
 
-class TestLuxSensorBehavior:
-    """Tests for lux sensor with hysteresis."""
-
-    async def test_lux_below_low_threshold_is_dark(
-        self, hass: HomeAssistant, lux_sensor_entry
-    ):
-        """Test lux below LOW threshold (30) indicates dark."""
-        hass.states.async_set("binary_sensor.motion", "off")
-        hass.states.async_set("light.test", "off")
-        hass.states.async_set("sensor.illuminance", "20", {"unit_of_measurement": "lx"})
-
-        coordinator = MotionLightsCoordinator(hass, lux_sensor_entry)
-        await coordinator.async_setup_listeners()
-
-        try:
-            context = coordinator._get_context()
-            assert context["is_dark_inside"] is True
-            assert coordinator._brightness_mode_is_dim is True
-        finally:
-            coordinator.async_cleanup_listeners()
+class TestBinarySensorBehavior:
+    """Tests for binary ambient light sensor behavior."""
 
-    async def test_lux_above_high_threshold_is_bright(
-        self, hass: HomeAssistant, lux_sensor_entry
+    @pytest.mark.parametrize(
+        ("ambient", "expected_brightness"), [("on", 80), ("off", 0)]
+    )
+    async def test_binary_sensor_brightness(
+        self,
+        hass: HomeAssistant,
+        make_coordinator,
+        strategy_80_10,
+        ambient,
+        expected_brightness,
     ):
-        """Test lux above HIGH threshold (70) indicates bright."""
+        """Test that binary sensor ON indicates dark and OFF indicates bright."""
         hass.states.async_set("binary_sensor.motion", "off")
         hass.states.async_set("light.test", "off")
-        hass.states.async_set(
-            "sensor.illuminance", "100", {"unit_of_measurement": "lx"}
-        )
+        hass.states.async_set("binary_sensor.ambient_light", ambient)
 
-        coordinator = MotionLightsCoordinator(hass, lux_sensor_entry)
-        await coordinator.async_setup_listeners()
+        coordinator = await make_coordinator(_AMBIENT_DATA, setup_listeners=False)
 
-        try:
-            context = coordinator._get_context()
-            assert context["is_dark_inside"] is False
-            assert coordinator._brightness_mode_is_dim is False
-        finally:
-            coordinator.async_cleanup_listeners()
+        context = coordinator._get_context()
+        assert context["is_dark_inside"] is (ambient == "on")
+        assert strategy_80_10.get_brightness(context) == expected_brightness
 
-    async def test_hysteresis_stays_dim_in_deadzone(
-        self, hass: HomeAssistant, lux_sensor_entry
+    @pytest.mark.parametrize(
+        ("ambient", "expected_state"),
+        [
+            ("on", STATE_MOTION_AUTO),
+            # Bright: brightness 0, so motion returns to standby with lights off
+            ("off", STATE_IDLE),
+        ],
+    )
+    async def test_binary_sensor_motion_activation(
+        self,
+        hass: HomeAssistant,
+        make_coordinator,
+        ambient,
+        expected_state,
     ):
-        """Test hysteresis - once dim, stays dim until above HIGH threshold."""
+        """Test that motion only activates lights while ambient reports dark."""
         hass.states.async_set("binary_sensor.motion", "off")
         hass.states.async_set("light.test", "off")
-        hass.states.async_set("sensor.illuminance", "20", {"unit_of_measurement": "lx"})
-
-        coordinator = MotionLightsCoordinator(hass, lux_sensor_entry)
-        await coordinator.async_setup_listeners()
+        hass.states.async_set("binary_sensor.ambient_light", ambient)
 
-        try:
-            # Start dim
-            context = coordinator._get_context()
-            assert context["is_dark_inside"] is True
+        coordinator = await make_coordinator(_AMBIENT_DATA)
 
-            # Rise to 50 lux (deadzone) - stays dim
-            hass.states.async_set(
-                "sensor.illuminance", "50", {"unit_of_measurement": "lx"}
-            )
-            context = coordinator._get_context()
-            assert context["is_dark_inside"] is True
-
-            # Rise to 65 lux (still deadzone) - stays dim
-            hass.states.async_set(
-                "sensor.illuminance", "65", {"unit_of_measurement": "lx"}
-            )
-            context = coordinator._get_context()
-            assert context["is_dark_inside"] is True
+        assert coordinator.current_state == STATE_IDLE
 
-            # Rise to 75 lux (above HIGH) - switches to bright
-            hass.states.async_set(
-                "sensor.illuminance", "75", {"unit_of_measurement": "lx"}
-            )
-            context = coordinator._get_context()
-            assert context["is_dark_inside"] is False
-        finally:
-            coordinator.async_cleanup_listeners()
+        # Trigger motion
+        hass.states.async_set("binary_sensor.motion", "on")
+        await hass.async_block_till_done()
 
-    async def test_hysteresis_stays_bright_in_deadzone(
-        self, hass: HomeAssistant, lux_sensor_entry
-    ):
-        """Test hysteresis - once bright, stays bright until below LOW threshold."""
-        hass.states.async_set("binary_sensor.motion", "off")
-        hass.states.async_set("light.test", "off")
-        hass.states.async_set(
-            "sensor.illuminance", "100", {"unit_of_measurement": "lx"}
-        )
+        assert coordinator.current_state == expected_state
 
-        coordinator = MotionLightsCoordinator(hass, lux_sensor_entry)
-        await coordinator.async_setup_listeners()
 
-        try:
-            # Start bright
-            context = coordinator._get_context()
-            assert context["is_dark_inside"] is False
+# =============================================================================
+# Lux Sensor Tests
+# =============================================================================
 
-            # Drop to 50 lux (deadzone) - stays bright
-            hass.states.async_set(
-                "sensor.illuminance", "50", {"unit_of_measurement": "lx"}
-            )
-            context = coordinator._get_context()
-            assert context["is_dark_inside"] is False
 
-            # Drop to 35 lux (still deadzone) - stays bright
-            hass.states.async_set(
-                "sensor.illuminance", "35", {"unit_of_measurement": "lx"}
-            )
-            context = coordinator._get_context()
-            assert context["is_dark_inside"] is False
+class TestLuxSensorBehavior:
+    """Tests for lux sensor with hysteresis.
 
-            # Drop to 25 lux (below LOW) - switches to dim
-            hass.states.async_set(
-                "sensor.illuminance", "25", {"unit_of_measurement": "lx"}
-            )
-            context = coordinator._get_context()
-            assert context["is_dark_inside"] is True
-        finally:
-            coordinator.async_cleanup_listeners()
+    _get_context() reads hass.states directly, so these tests assert right
+    after async_set without draining the event loop.
+    """
 
-    async def test_hysteresis_prevents_cloud_flickering(
-        self, hass: HomeAssistant, lux_sensor_entry
+    @pytest.mark.parametrize(
+        ("name", "threshold", "seq"),
+        HYSTERESIS_CASES,
+        ids=[case[0] for case in HYSTERESIS_CASES],
+    )
+    async def test_hysteresis(
+        self,
+        hass: HomeAssistant,
+        make_coordinator,
+        name: str,
+        threshold: int,
+        seq: list[tuple[int | str, bool, bool | None]],
     ):
-        """Test that brief lux changes (like clouds) don't cause mode switching."""
+        """Test lux sequences against the threshold's +/-20 lux hysteresis band."""
+        first_lux = seq[0][0]
         hass.states.async_set("binary_sensor.motion", "off")
         hass.states.async_set("light.test", "off")
-        hass.states.async_set("sensor.illuminance", "80", {"unit_of_measurement": "lx"})
-
-        coordinator = MotionLightsCoordinator(hass, lux_sensor_entry)
-        await coordinator.async_setup_listeners()
+        hass.states.async_set("sensor.illuminance", str(first_lux), _LUX_ATTRS)
 
-        try:
-            # Start bright
-            context = coordinator._get_context()
-            assert context["is_dark_inside"] is False
-
-            # Cloud passes - drops to 45 lux (deadzone)
-            hass.states.async_set(
-                "sensor.illuminance", "45", {"unit_of_measurement": "lx"}
-            )
-            context = coordinator._get_context()
-            assert context["is_dark_inside"] is False  # Stays bright
-
-            # Cloud passes - back to 60 lux
-            hass.states.async_set(
-                "sensor.illuminance", "60", {"unit_of_measurement": "lx"}
-            )
-            context = coordinator._get_context()
-            assert context["is_dark_inside"] is False  # Still bright
+        coordinator = await make_coordinator(
+            {**_LUX_DATA, CONF_AMBIENT_LIGHT_THRESHOLD: threshold},
+            setup_listeners=False,
+        )
 
-            # Another cloud - drops to 40 lux
-            hass.states.async_set(
-                "sensor.illuminance", "40", {"unit_of_measurement": "lx"}
+        for lux, expected, expected_dim in seq:
+            # state is synchronous; no flush needed
+            _set_lux(hass, lux)
+            assert _is_dark(coordinator) is expected, f"{name}: {lux} lx"
+            assert coordinator._brightness_mode_is_dim is expected_dim, (
+                f"{name}: {lux} lx mode"
             )
-            context = coordinator._get_context()
-            assert context["is_dark_inside"] is False  # Still bright
-        finally:
-            coordinator.async_cleanup_listeners()
 
-    async def test_invalid_lux_value_falls_back_to_dim(
-        self, hass: HomeAssistant, lux_sensor_entry
+    async def test_context_reused_until_inputs_change(
+        self, hass: HomeAssistant, make_coordinator
     ):
-        """Test that invalid lux values fall back to dim mode."""
-        hass.states.async_set("binary_sensor.motion", "off")
-        hass.states.async_set("light.test", "off")
-        hass.states.async_set(
-            "sensor.illuminance", "unknown", {"unit_of_measurement": "lx"}
-        )
-
-        coordinator = MotionLightsCoordinator(hass, lux_sensor_entry)
-        await coordinator.async_setup_listeners()
-
-        try:
-            context = coordinator._get_context()
-            assert context["is_dark_inside"] is True
-        finally:
-            coordinator.async_cleanup_listeners()
-
-    async def test_custom_threshold_values(self, hass: HomeAssistant):
-        """Test custom threshold values work correctly."""
-        hass.states.async_set("binary_sensor.motion", "off")
-        hass.states.async_set("light.test", "off")
-        hass.states.async_set("sensor.illuminance", "50", {"unit_of_measurement": "lx"})
-
-        config_entry = ConfigEntry(
-            version=1,
-            minor_version=1,
-            domain=DOMAIN,
-            title="Test Custom Threshold",
-            data={
-                CONF_MOTION_ENTITY: ["binary_sensor.motion"],
-                CONF_LIGHTS: ["light.test"],
-                CONF_AMBIENT_LIGHT_SENSOR: "sensor.illuminance",
-                CONF_AMBIENT_LIGHT_THRESHOLD: 100,  # LOW=80, HIGH=120
-                CONF_EXTENDED_TIMEOUT: 1200,
-            },
-            options={},
-            entry_id="test_custom_threshold",
-            source="user",
-            unique_id=None,
-            discovery_keys={},
-        )
-
-        coordinator = MotionLightsCoordinator(hass, config_entry)
-        await coordinator.async_setup_listeners()
-
-        try:
-            # 50 lux below threshold (100) - dim
-            context = coordinator._get_context()
-            assert context["is_dark_inside"] is True
+        """Test that _get_context() returns the same context until a state changes."""
+        _set_lux(hass, 25)
+        coordinator = await make_coordinator(_LUX_DATA, setup_listeners=False)
+
+        first = coordinator._get_context()
+        assert coordinator._get_context() is first
+        # Shared between callers, so it must not be writable
+        with pytest.raises(TypeError):
+            first["is_dark_inside"] = False
+
+        _set_lux(hass, 90)
+        second = coordinator._get_context()
+        assert second is not first
+        assert second["is_dark_inside"] is False
+
+    @pytest.mark.parametrize(
+        ("lux", "message"),
+        [("unknown", "Could not parse lux value"), (None, "not found")],
+        ids=["unparsable", "missing"],
+    )
+    async def test_context_not_cached_after_warning(
+        self,
+        hass: HomeAssistant,
+        make_coordinator,
+        caplog: pytest.LogCaptureFixture,
+        lux: str | None,
+        message: str,
+    ):
+        """Test that a context built while logging a warning is not reused."""
+        if lux is not None:
+            _set_lux(hass, lux)
+        coordinator = await make_coordinator(_LUX_DATA, setup_listeners=False)
 
-            # 90 lux (deadzone 80-120) - stays dim
-            hass.states.async_set(
-                "sensor.illuminance", "90", {"unit_of_measurement": "lx"}
-            )
-            context = coordinator._get_context()
-            assert context["is_dark_inside"] is True
+        first = coordinator._get_context()
+        second = coordinator._get_context()
 
-            # 125 lux (above 120) - switches to bright
-            hass.states.async_set(
-                "sensor.illuminance", "125", {"unit_of_measurement": "lx"}
-            )
-            context = coordinator._get_context()
-            assert context["is_dark_inside"] is False
-        finally:
-            coordinator.async_cleanup_listeners()
+        assert second is not first
+        assert second["is_dark_inside"] is True
+        assert sum(message in record.getMessage() for record in caplog.records) == 2
 
 
 # =============================================================================
@@ -427,15 +319,14 @@ class TestAmbientStateChanges:
     """Tests for reactions to ambient light state changes."""
 
     async def test_becoming_dark_with_motion_turns_on_lights(
-        self, hass: HomeAssistant, basic_ambient_entry
+        self, hass: HomeAssistant, make_coordinator
     ):
         """Test that becoming dark with active motion turns on lights."""
         hass.states.async_set("binary_sensor.motion", STATE_ON)
         hass.states.async_set("light.test", STATE_OFF)
         hass.states.async_set("binary_sensor.ambient_light", STATE_OFF)  # Bright
 
-        coordinator = MotionLightsCoordinator(hass, basic_ambient_entry)
-        await coordinator.async_setup_listeners()
+        coordinator = await make_coordinator(_AMBIENT_DATA)
 
         assert coordinator.state_machine.current_state == STATE_IDLE
 
@@ -444,18 +335,19 @@ class TestAmbientStateChanges:
         await hass.async_block_till_done()
 
         assert coordinator.state_machine.current_state == STATE_MOTION_AUTO
-        coordinator.async_cleanup_listeners()
 
     async def test_becoming_bright_turns_off_auto_lights(
-        self, hass: HomeAssistant, basic_ambient_entry
+        self,
+        hass: HomeAssistant,
+        make_coordinator,
+        mock_light_controller,
     ):
         """Test that becoming bright turns off auto-controlled lights."""
         hass.states.async_set("binary_sensor.motion", STATE_OFF)
         hass.states.async_set("light.test", STATE_OFF)
         hass.states.async_set("binary_sensor.ambient_light", STATE_ON)  # Dark
 
-        coordinator = MotionLightsCoordinator(hass, basic_ambient_entry)
-        await coordinator.async_setup_listeners()
+        coordinator = await make_coordinator(_AMBIENT_DATA)
 
         # Turn on motion
         hass.states.async_set("binary_sensor.motion", STATE_ON)
@@ -463,37 +355,60 @@ class TestAmbientStateChanges:
         assert coordinator.state_machine.current_state == STATE_MOTION_AUTO
 
         # Become bright - should turn off lights
-        with patch.object(
-            coordinator.light_controller, "turn_off_lights", new_callable=AsyncMock
-        ) as mock_turn_off:
-            hass.states.async_set("binary_sensor.ambient_light", STATE_OFF)
-            await hass.async_block_till_done()
-            mock_turn_off.assert_called_once()
-
-        coordinator.async_cleanup_listeners()
+        mock_turn_off = mock_light_controller(coordinator, "turn_off_lights")
+        hass.states.async_set("binary_sensor.ambient_light", STATE_OFF)
+        await hass.async_block_till_done()
+        mock_turn_off.assert_called_once()
 
     async def test_becoming_bright_in_manual_state_doesnt_force_off(
-        self, hass: HomeAssistant, basic_ambient_entry
+        self,
+        hass: HomeAssistant,
+        make_coordinator,
+        mock_light_controller,
     ):
         """Test that becoming bright in MANUAL state doesn't force lights off."""
         hass.states.async_set("binary_sensor.motion", STATE_OFF)
         hass.states.async_set("light.test", STATE_ON)
         hass.states.async_set("binary_sensor.ambient_light", STATE_ON)
 
-        coordinator = MotionLightsCoordinator(hass, basic_ambient_entry)
-        await coordinator.async_setup_listeners()
+        coordinator = await make_coordinator(_AMBIENT_DATA)
 
         coordinator.state_machine.force_state(STATE_MANUAL)
 
-        with patch.object(
-            coordinator.light_controller, "turn_off_lights", new_callable=AsyncMock
-        ) as mock_turn_off:
-            hass.states.async_set("binary_sensor.ambient_light", STATE_OFF)
-            await hass.async_block_till_done()
-            mock_turn_off.assert_not_called()
+        mock_turn_off = mock_light_controller(coordinator, "turn_off_lights")
+        hass.states.async_set("binary_sensor.ambient_light", STATE_OFF)
+        await hass.async_block_till_done()
+        mock_turn_off.assert_not_called()
 
         assert coordinator.state_machine.current_state == STATE_MANUAL
-        coordinator.async_cleanup_listeners()
+
+    async def test_attribute_only_update_skips_reevaluation(
+        self,
+        hass: HomeAssistant,
+        make_coordinator,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test that a repeated lux reading with new attributes is ignored."""
+        hass.states.async_set("binary_sensor.motion", STATE_OFF)
+        hass.states.async_set("light.test", STATE_OFF)
+        hass.states.async_set("sensor.illuminance", "20", _LUX_ATTRS)
+
+        coordinator = await make_coordinator(_LUX_DATA)
+
+        get_context = MagicMock(wraps=coordinator._get_context)
+        monkeypatch.setattr(coordinator, "_get_context", get_context)
+
+        hass.states.async_set(
+            "sensor.illuminance",
+            "20",
+            {"unit_of_measurement": "lx", "friendly_name": "Lux"},
+        )
+        await hass.async_block_till_done()
+        get_context.assert_not_called()
+
+        _set_lux(hass, 100)
+        await hass.async_block_till_done()
+        get_context.assert_called()
 
 
 # =============================================================================
@@ -504,35 +419,16 @@ class TestAmbientStateChanges:
 class TestHouseActiveIntegration:
     """Tests for house active switch integration with ambient light."""
 
-    async def test_house_active_changes_adjusts_brightness(self, hass: HomeAssistant):
+    async def test_house_active_changes_adjusts_brightness(
+        self, hass: HomeAssistant, make_coordinator, mock_light_controller
+    ):
         """Test that house active state change adjusts brightness."""
-        entry = ConfigEntry(
-            version=1,
-            minor_version=1,
-            domain=DOMAIN,
-            title="Test House Active",
-            data={
-                CONF_NAME: "Test Room",
-                CONF_MOTION_ENTITY: ["binary_sensor.motion"],
-                CONF_LIGHTS: ["light.test"],
-                CONF_AMBIENT_LIGHT_SENSOR: "binary_sensor.ambient",
-                CONF_HOUSE_ACTIVE: "input_boolean.house_active",
-                CONF_MOTION_ACTIVATION: True,
-            },
-            options={},
-            entry_id="test_house_active",
-            source="user",
-            unique_id="test_house_active_unique",
-            discovery_keys={},
-        )
-
         hass.states.async_set("binary_sensor.motion", STATE_OFF)
         hass.states.async_set("light.test", STATE_OFF)
         hass.states.async_set("binary_sensor.ambient", STATE_ON)  # Dark
         hass.states.async_set("input_boolean.house_active", STATE_OFF)
 
-        coordinator = MotionLightsCoordinator(hass, entry)
-        await coordinator.async_setup_listeners()
+        coordinator = await make_coordinator(_HOUSE_ACTIVE_DATA)
 
         # Turn on motion
         hass.states.async_set("binary_sensor.motion", STATE_ON)
@@ -544,46 +440,25 @@ class TestHouseActiveIntegration:
         await hass.async_block_till_done()
 
         # Activate house - should adjust brightness
-        with patch.object(
-            coordinator.light_controller, "turn_on_auto_lights", new_callable=AsyncMock
-        ) as mock_turn_on:
-            hass.states.async_set("input_boolean.house_active", STATE_ON)
-            await hass.async_block_till_done()
-            mock_turn_on.assert_called_once()
-
-        coordinator.async_cleanup_listeners()
+        mock_turn_on = mock_light_controller(coordinator, "turn_on_auto_lights")
+        hass.states.async_set("input_boolean.house_active", STATE_ON)
+        await hass.async_block_till_done()
+        mock_turn_on.assert_called_once()
 
     async def test_house_becomes_inactive_keeps_brightness(
-        self, hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+        self,
+        hass: HomeAssistant,
+        make_coordinator,
+        caplog: pytest.LogCaptureFixture,
+        mock_light_controller,
     ):
         """Test that house becoming inactive keeps current brightness without adjustment."""
-        entry = ConfigEntry(
-            version=1,
-            minor_version=1,
-            domain=DOMAIN,
-            title="Test House Inactive",
-            data={
-                CONF_NAME: "Test Room",
-                CONF_MOTION_ENTITY: ["binary_sensor.motion"],
-                CONF_LIGHTS: ["light.test"],
-                CONF_AMBIENT_LIGHT_SENSOR: "binary_sensor.ambient",
-                CONF_HOUSE_ACTIVE: "input_boolean.house_active",
-                CONF_MOTION_ACTIVATION: True,
-            },
-            options={},
-            entry_id="test_house_inactive",
-            source="user",
-            unique_id="test_house_inactive_unique",
-            discovery_keys={},
-        )
-
         hass.states.async_set("binary_sensor.motion", STATE_OFF)
         hass.states.async_set("light.test", STATE_OFF)
         hass.states.async_set("binary_sensor.ambient", STATE_ON)  # Dark
         hass.states.async_set("input_boolean.house_active", STATE_ON)  # Start active
 
-        coordinator = MotionLightsCoordinator(hass, entry)
-        await coordinator.async_setup_listeners()
+        coordinator = await make_coordinator(_HOUSE_ACTIVE_DATA)
 
         # Turn on motion to activate lights
         hass.states.async_set("binary_sensor.motion", STATE_ON)
@@ -595,24 +470,20 @@ class TestHouseActiveIntegration:
         await hass.async_block_till_done()
 
         # Deactivate house - should NOT adjust brightness
-        with patch.object(
-            coordinator.light_controller, "turn_on_auto_lights", new_callable=AsyncMock
-        ) as mock_turn_on:
-            with caplog.at_level(logging.DEBUG):
-                hass.states.async_set("input_boolean.house_active", STATE_OFF)
-                await hass.async_block_till_done()
-
-                # Verify turn_on_auto_lights was NOT called
-                mock_turn_on.assert_not_called()
+        mock_turn_on = mock_light_controller(coordinator, "turn_on_auto_lights")
+        with caplog.at_level(logging.DEBUG):
+            hass.states.async_set("input_boolean.house_active", STATE_OFF)
+            await hass.async_block_till_done()
 
-                # Verify the debug log message was generated
-                assert any(
-                    "House became inactive but lights are on - keeping current brightness"
-                    in record.message
-                    for record in caplog.records
-                )
+            # Verify turn_on_auto_lights was NOT called
+            mock_turn_on.assert_not_called()
 
-        coordinator.async_cleanup_listeners()
+            # Verify the debug log message was generated
+            assert any(
+                "House became inactive but lights are on - keeping current brightness"
+                in record.message
+                for record in caplog.records
+            )
 
 
 # =============================================================================
@@ -623,44 +494,20 @@ class TestHouseActiveIntegration:
 class TestNoAmbientSensor:
     """Tests for behavior when no ambient sensor is configured."""
 
-    async def test_no_ambient_sensor_defaults_to_dark(self, hass: HomeAssistant):
+    async def test_no_ambient_sensor_defaults_to_dark(
+        self, hass: HomeAssistant, make_coordinator, strategy_80_10
+    ):
         """Test that without ambient sensor, defaults to dark (allows activation)."""
         hass.states.async_set("binary_sensor.motion", "off")
         hass.states.async_set("light.test", "off")
 
-        config_entry = ConfigEntry(
-            version=1,
-            minor_version=1,
-            domain=DOMAIN,
-            title="Test No Ambient",
-            data={
-                CONF_MOTION_ENTITY: ["binary_sensor.motion"],
-                CONF_LIGHTS: ["light.test"],
-                CONF_BRIGHTNESS_ACTIVE: 80,
-                CONF_BRIGHTNESS_INACTIVE: 10,
-                CONF_EXTENDED_TIMEOUT: 1200,
-            },
-            options={},
-            entry_id="test_no_ambient",
-            source="user",
-            unique_id=None,
-            discovery_keys={},
-        )
-
-        coordinator = MotionLightsCoordinator(hass, config_entry)
-        await coordinator.async_setup_listeners()
+        coordinator = await make_coordinator(_NO_AMBIENT_DATA, setup_listeners=False)
 
-        try:
-            context = coordinator._get_context()
-            assert context["is_dark_inside"] is True
+        context = coordinator._get_context()
+        assert context["is_dark_inside"] is True
 
-            strategy = TimeOfDayBrightnessStrategy(
-                active_brightness=80, inactive_brightness=10
-            )
-            brightness = strategy.get_brightness(context)
-            assert brightness == 80
-        finally:
-            coordinator.async_cleanup_listeners()
+        brightness = strategy_80_10.get_brightness(context)
+        assert brightness == 80
 
 
 # =============================================================================
@@ -671,44 +518,23 @@ class TestNoAmbientSensor:
 class TestLuxSensorWithMotion:
     """Tests for lux sensor integration with motion activation."""
 
-    async def test_lux_sensor_with_motion_activation(self, hass: HomeAssistant):
+    async def test_lux_sensor_with_motion_activation(
+        self, hass: HomeAssistant, make_coordinator
+    ):
         """Test lux sensor works correctly with motion activation."""
         hass.states.async_set("binary_sensor.motion", "off")
         hass.states.async_set("light.test", "off")
-        hass.states.async_set("sensor.illuminance", "20", {"unit_of_measurement": "lx"})
-
-        config_entry = ConfigEntry(
-            version=1,
-            minor_version=1,
-            domain=DOMAIN,
-            title="Test Lux with Motion",
-            data={
-                CONF_MOTION_ENTITY: ["binary_sensor.motion"],
-                CONF_LIGHTS: ["light.test"],
-                CONF_AMBIENT_LIGHT_SENSOR: "sensor.illuminance",
-                CONF_AMBIENT_LIGHT_THRESHOLD: 50,
-                CONF_MOTION_ACTIVATION: True,
-                CONF_EXTENDED_TIMEOUT: 1200,
-            },
-            options={},
-            entry_id="test_lux_motion",
-            source="user",
-            unique_id="test_lux_motion_unique",
-            discovery_keys={},
-        )
+        hass.states.async_set("sensor.illuminance", "20", _LUX_ATTRS)
 
-        coordinator = MotionLightsCoordinator(hass, config_entry)
-        await coordinator.async_setup_listeners()
+        coordinator = await make_coordinator(
+            {**_LUX_DATA, CONF_MOTION_ACTIVATION: True}
+        )
 
-        try:
-            assert coordinator.current_state == STATE_IDLE
+        assert coordinator.current_state == STATE_IDLE
 
-            # Trigger motion
-            hass.states.async_set("binary_sensor.motion", "on")
-            await hass.async_block_till_done()
+        # Trigger motion
+        hass.states.async_set("binary_sensor.motion", "on")
+        await hass.async_block_till_done()
 
-            assert coordinator.current_state == STATE_MOTION_AUTO
-            context = coordinator._get_context()
-            assert context["is_dark_inside"] is True
-        finally:
-            coordinator.async_cleanup_listeners()
+        assert coordinator.current_state == STATE_MOTION_AUTO
+        assert _is_dark(coordinator) is True
@@ -1,5 +1,8 @@
 """Test diagnostic sensor functionality."""
 
+from types import MappingProxyType
+
+import pytest
 from homeassistant.const import STATE_OFF, STATE_ON
 from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
@@ -17,107 +20,30 @@ from custom_components.motion_lights_automation.const import (
     DOMAIN,
 )
 
-
-async def test_diagnostic_sensor_created(hass: HomeAssistant) -> None:
-    """Test that diagnostic sensor is created."""
-    config_entry = MockConfigEntry(
-        domain=DOMAIN,
-        data={
-            CONF_MOTION_ENTITY: ["binary_sensor.motion"],
-            CONF_LIGHTS: ["light.test"],
-            CONF_NO_MOTION_WAIT: 300,
-            CONF_EXTENDED_TIMEOUT: 1200,
-            CONF_BRIGHTNESS_ACTIVE: 100,
-            CONF_BRIGHTNESS_INACTIVE: 30,
-            CONF_MOTION_ACTIVATION: True,
-        },
-        entry_id="test_diagnostic",
-    )
-
-    # Set up mock entities
-    hass.states.async_set("binary_sensor.motion", STATE_OFF)
-    hass.states.async_set("light.test", STATE_OFF)
-
-    config_entry.add_to_hass(hass)
-    assert await hass.config_entries.async_setup(config_entry.entry_id)
-    await hass.async_block_till_done()
-
-    # Check that diagnostic sensor exists
-    # Entity ID is based on config entry title
-    diagnostic_sensor_entity_id = "sensor.mock_title_lighting_automation"
-    diagnostic_state = hass.states.get(diagnostic_sensor_entity_id)
-    assert diagnostic_state is not None
-    # State is now the last event message - after initialization it should show restart message
-    assert "Integration restarted" in diagnostic_state.state
-
-    # Cleanup
-    coordinator = config_entry.runtime_data
-    coordinator.async_cleanup_listeners()
-
-
-async def test_diagnostic_sensor_tracks_events(hass: HomeAssistant) -> None:
-    """Test that diagnostic sensor tracks events."""
-    config_entry = MockConfigEntry(
-        domain=DOMAIN,
-        data={
-            CONF_MOTION_ENTITY: ["binary_sensor.motion"],
-            CONF_LIGHTS: ["light.test"],
-            CONF_NO_MOTION_WAIT: 300,
-            CONF_EXTENDED_TIMEOUT: 1200,
-            CONF_BRIGHTNESS_ACTIVE: 100,
-            CONF_BRIGHTNESS_INACTIVE: 30,
-            CONF_MOTION_ACTIVATION: True,
-        },
-        entry_id="test_diagnostic_events",
-    )
-
-    # Set up mock entities
-    hass.states.async_set("binary_sensor.motion", STATE_OFF)
-    hass.states.async_set("light.test", STATE_OFF)
-
-    config_entry.add_to_hass(hass)
-    assert await hass.config_entries.async_setup(config_entry.entry_id)
-    await hass.async_block_till_done()
-
-    # Get diagnostic sensor
-    diagnostic_sensor_entity_id = "sensor.mock_title_lighting_automation"
-    diagnostic_state = hass.states.get(diagnostic_sensor_entity_id)
-    assert diagnostic_state is not None
-
-    # Trigger motion
-    hass.states.async_set("binary_sensor.motion", STATE_ON)
-    await hass.async_block_till_done()
-
-    # Check that event was logged
-    diagnostic_state = hass.states.get(diagnostic_sensor_entity_id)
-    event_log = diagnostic_state.attributes.get("event_log", [])
-    assert len(event_log) > 0
-
-    # Event log should contain motion-related event
-    # The format may vary, so check for common patterns
-    assert len(event_log) > 0, "Event log should not be empty after motion"
-    log_text = " ".join(event_log).lower()
-    assert "motion" in log_text, f"Expected 'motion' in event log: {event_log}"
-
-    # Cleanup
-    coordinator = config_entry.runtime_data
-    coordinator.async_cleanup_listeners()
+# Entity ID is based on config entry title
+DIAGNOSTIC_SENSOR_ENTITY_ID = "sensor.mock_title_lighting_automation"
+
+# Entry data shared by every test; the conditions test adds its sensors on top
+_BASE_DATA = MappingProxyType(
+    {
+        CONF_MOTION_ENTITY: ("binary_sensor.motion",),
+        CONF_LIGHTS: ("light.test",),
+        CONF_NO_MOTION_WAIT: 300,
+        CONF_EXTENDED_TIMEOUT: 1200,
+        CONF_BRIGHTNESS_ACTIVE: 100,
+        CONF_BRIGHTNESS_INACTIVE: 30,
+        CONF_MOTION_ACTIVATION: True,
+    }
+)
 
 
-async def test_diagnostic_sensor_tracks_transitions(hass: HomeAssistant) -> None:
-    """Test that diagnostic sensor tracks state transitions."""
+@pytest.fixture
+async def diagnostic_entry(hass: HomeAssistant):
+    """Set up the integration with motion and one light, unloading it afterwards."""
     config_entry = MockConfigEntry(
         domain=DOMAIN,
-        data={
-            CONF_MOTION_ENTITY: ["binary_sensor.motion"],
-            CONF_LIGHTS: ["light.test"],
-            CONF_NO_MOTION_WAIT: 300,
-            CONF_EXTENDED_TIMEOUT: 1200,
-            CONF_BRIGHTNESS_ACTIVE: 100,
-            CONF_BRIGHTNESS_INACTIVE: 30,
-            CONF_MOTION_ACTIVATION: True,
-        },
-        entry_id="test_diagnostic_transitions",
+        data=dict(_BASE_DATA),
+        entry_id="test_diagnostic",
     )
 
     # Set up mock entities
@@ -128,27 +54,67 @@ async def test_diagnostic_sensor_tracks_transitions(hass: HomeAssistant) -> None
     assert await hass.config_entries.async_setup(config_entry.entry_id)
     await hass.async_block_till_done()
 
-    # Get diagnostic sensor
-    diagnostic_sensor_entity_id = "sensor.mock_title_lighting_automation"
-
-    # Trigger motion to cause state transition
-    hass.states.async_set("binary_sensor.motion", STATE_ON)
-    await hass.async_block_till_done()
-
-    diagnostic_state = hass.states.get(diagnostic_sensor_entity_id)
-    assert diagnostic_state is not None
-
-    # Check last transition info
-    last_transition_reason = diagnostic_state.attributes.get("last_transition_reason")
-    assert last_transition_reason is not None
-    assert "motion_on" in last_transition_reason
-
-    last_transition_time = diagnostic_state.attributes.get("last_transition_time")
-    assert last_transition_time is not None
-
-    # Cleanup
-    coordinator = config_entry.runtime_data
-    coordinator.async_cleanup_listeners()
+    yield config_entry
+
+    # Unloading the entry tears down the coordinator
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+
+
+class TestDiagnosticSensor:
+    """Tests sharing the motion + light diagnostic setup."""
+
+    async def test_diagnostic_sensor_created(
+        self, hass: HomeAssistant, diagnostic_entry
+    ) -> None:
+        """Test that diagnostic sensor is created."""
+        # Check that diagnostic sensor exists
+        diagnostic_state = hass.states.get(DIAGNOSTIC_SENSOR_ENTITY_ID)
+        assert diagnostic_state is not None
+        # State is now the last event message - after initialization it should show restart message
+        assert "Integration restarted" in diagnostic_state.state
+
+    async def test_diagnostic_sensor_tracks_events(
+        self, hass: HomeAssistant, diagnostic_entry
+    ) -> None:
+        """Test that diagnostic sensor tracks events."""
+        # Get diagnostic sensor
+        diagnostic_state = hass.states.get(DIAGNOSTIC_SENSOR_ENTITY_ID)
+        assert diagnostic_state is not None
+
+        # Trigger motion
+        hass.states.async_set("binary_sensor.motion", STATE_ON)
+        await hass.async_block_till_done()
+
+        # Check that event was logged
+        diagnostic_state = hass.states.get(DIAGNOSTIC_SENSOR_ENTITY_ID)
+        event_log = diagnostic_state.attributes.get("event_log", [])
+
+        # Event log should contain motion-related event
+        # The format may vary, so check for common patterns
+        assert len(event_log) > 0, "Event log should not be empty after motion"
+        log_text = " ".join(event_log).lower()
+        assert "motion" in log_text, f"Expected 'motion' in event log: {event_log}"
+
+    async def test_diagnostic_sensor_tracks_transitions(
+        self, hass: HomeAssistant, diagnostic_entry
+    ) -> None:
+        """Test that diagnostic sensor tracks state transitions."""
+        # Trigger motion to cause state transition
+        hass.states.async_set("binary_sensor.motion", STATE_ON)
+        await hass.async_block_till_done()
+
+        diagnostic_state = hass.states.get(DIAGNOSTIC_SENSOR_ENTITY_ID)
+        assert diagnostic_state is not None
+
+        # Check last transition info
+        last_transition_reason = diagnostic_state.attributes.get(
+            "last_transition_reason"
+        )
+        assert last_transition_reason is not None
+        assert "motion_on" in last_transition_reason
+
+        last_transition_time = diagnostic_state.attributes.get("last_transition_time")
+        assert last_transition_time is not None
 
 
 async def test_diagnostic_sensor_shows_conditions(hass: HomeAssistant) -> None:
@@ -156,15 +122,9 @@ async def test_diagnostic_sensor_shows_conditions(hass: HomeAssistant) -> None:
     config_entry = MockConfigEntry(
         domain=DOMAIN,
         data={
-            CONF_MOTION_ENTITY: ["binary_sensor.motion"],
-            CONF_LIGHTS: ["light.test"],
+            **_BASE_DATA,
             CONF_HOUSE_ACTIVE: ["switch.house_active"],
             CONF_AMBIENT_LIGHT_SENSOR: ["binary_sensor.ambient"],
-            CONF_NO_MOTION_WAIT: 300,
-            CONF_EXTENDED_TIMEOUT: 1200,
-            CONF_BRIGHTNESS_ACTIVE: 100,
-            CONF_BRIGHTNESS_INACTIVE: 30,
-            CONF_MOTION_ACTIVATION: True,
         },
         entry_id="test_diagnostic_conditions",
     )
@@ -180,8 +140,7 @@ async def test_diagnostic_sensor_shows_conditions(hass: HomeAssistant) -> None:
     await hass.async_block_till_done()
 
     # Get diagnostic sensor
-    diagnostic_sensor_entity_id = "sensor.mock_title_lighting_automation"
-    diagnostic_state = hass.states.get(diagnostic_sensor_entity_id)
+    diagnostic_state = hass.states.get(DIAGNOSTIC_SENSOR_ENTITY_ID)
     assert diagnostic_state is not None
 
     # Check conditions are tracked
@@ -197,6 +156,5 @@ async def test_diagnostic_sensor_shows_conditions(hass: HomeAssistant) -> None:
     assert is_house_active is True
     assert motion_activation_enabled is True
 
-    # Cleanup
-    coordinator = config_entry.runtime_data
-    coordinator.async_cleanup_listeners()
+    # Unloading the entry tears down the coordinator
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import timedelta
+from types import MappingProxyType
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -25,6 +26,17 @@ from custom_components.motion_lights_automation.motion_coordinator import (
     MotionLightsCoordinator,
 )
 
+# Immutable ConfigEntry fields shared by every entry in this module; options and
+# discovery_keys stay fresh per entry since ConfigEntry keeps them as passed
+_BASE_ENTRY_KW = MappingProxyType(
+    {
+        "version": 1,
+        "minor_version": 1,
+        "domain": DOMAIN,
+        "source": "user",
+    }
+)
+
 
 async def test_motion_delay_zero_activates_immediately(hass: HomeAssistant) -> None:
     """Test that delay=0 activates lights immediately (default behavior)."""
@@ -33,9 +45,9 @@ async def test_motion_delay_zero_activates_immediately(hass: HomeAssistant) -> N
     hass.states.async_set("light.test", "off")
 
     config_entry = ConfigEntry(
-        version=1,
-        minor_version=1,
-        domain=DOMAIN,
+        **_BASE_ENTRY_KW,
+        options={},
+        discovery_keys={},
         title="Test Motion Lights",
         data={
             CONF_MOTION_ENTITY: ["binary_sensor.motion"],
@@ -44,11 +56,8 @@ async def test_motion_delay_zero_activates_immediately(hass: HomeAssistant) -> N
             CONF_MOTION_DELAY: 0,  # No delay
             CONF_EXTENDED_TIMEOUT: 1200,
         },
-        options={},
         entry_id="test_entry_id",
-        source="user",
         unique_id=None,
-        discovery_keys={},
     )
 
     coordinator = MotionLightsCoordinator(hass, config_entry)
@@ -75,9 +84,9 @@ async def test_motion_delay_activates_after_delay(hass: HomeAssistant) -> None:
     hass.states.async_set("light.test", "off")
 
     config_entry = ConfigEntry(
-        version=1,
-        minor_version=1,
-        domain=DOMAIN,
+        **_BASE_ENTRY_KW,
+        options={},
+        discovery_keys={},
         title="Test Motion Lights",
         data={
             CONF_MOTION_ENTITY: ["binary_sensor.motion"],
@@ -86,11 +95,8 @@ async def test_motion_delay_activates_after_delay(hass: HomeAssistant) -> None:
             CONF_MOTION_DELAY: 5,  # 5 second delay
             CONF_EXTENDED_TIMEOUT: 1200,
         },
-        options={},
         entry_id="test_entry_id",
-        source="user",
         unique_id=None,
-        discovery_keys={},
     )
 
     coordinator = MotionLightsCoordinator(hass, config_entry)
@@ -134,9 +140,9 @@ async def test_motion_delay_multiple_instances_stagger(hass: HomeAssistant) -> N
 
     # Instance 1: Kitchen with 0s delay
     config_kitchen = ConfigEntry(
-        version=1,
-        minor_version=1,
-        domain=DOMAIN,
+        **_BASE_ENTRY_KW,
+        options={},
+        discovery_keys={},
         title="Kitchen Lights",
         data={
             CONF_MOTION_ENTITY: ["binary_sensor.motion"],
@@ -144,18 +150,15 @@ async def test_motion_delay_multiple_instances_stagger(hass: HomeAssistant) -> N
             CONF_MOTION_DELAY: 0,
             CONF_EXTENDED_TIMEOUT: 1200,
         },
-        options={},
         entry_id="kitchen_id",
-        source="user",
         unique_id="kitchen",
-        discovery_keys={},
     )
 
     # Instance 2: Hallway with 2s delay
     config_hallway = ConfigEntry(
-        version=1,
-        minor_version=1,
-        domain=DOMAIN,
+        **_BASE_ENTRY_KW,
+        options={},
+        discovery_keys={},
         title="Hallway Lights",
         data={
             CONF_MOTION_ENTITY: ["binary_sensor.motion"],
@@ -163,18 +166,15 @@ async def test_motion_delay_multiple_instances_stagger(hass: HomeAssistant) -> N
             CONF_MOTION_DELAY: 2,
             CONF_EXTENDED_TIMEOUT: 1200,
         },
-        options={},
         entry_id="hallway_id",
-        source="user",
         unique_id="hallway",
-        discovery_keys={},
     )
 
     # Instance 3: Bedroom with 4s delay
     config_bedroom = ConfigEntry(
-        version=1,
-        minor_version=1,
-        domain=DOMAIN,
+        **_BASE_ENTRY_KW,
+        options={},
+        discovery_keys={},
         title="Bedroom Lights",
         data={
             CONF_MOTION_ENTITY: ["binary_sensor.motion"],
@@ -182,11 +182,8 @@ async def test_motion_delay_multiple_instances_stagger(hass: HomeAssistant) -> N
             CONF_MOTION_DELAY: 4,
             CONF_EXTENDED_TIMEOUT: 1200,
         },
-        options={},
         entry_id="bedroom_id",
-        source="user",
         unique_id="bedroom",
-        discovery_keys={},
     )
 
     coord_kitchen = MotionLightsCoordinator(hass, config_kitchen)
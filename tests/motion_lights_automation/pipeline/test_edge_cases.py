@@ -22,6 +22,20 @@ from custom_components.motion_lights_automation.state_machine import (
 )
 from tests.motion_lights_automation.pipeline.conftest import CoordinatorHarness
 
+# Keys the diagnostic sensor relies on; get_diagnostic_data() may add more
+_ESSENTIAL_DIAGNOSTIC_KEYS = frozenset(
+    {
+        "current_state",
+        "timers",
+        "lights_on",
+        "total_lights",
+        "motion_active",
+        "event_log",
+        "last_event_message",
+        "last_transition_reason",
+    }
+)
+
 
 # ===================================================================
 # TestStartupBehavior
@@ -281,17 +295,7 @@ class TestDiagnosticData:
         """Diagnostic data includes essential keys."""
         diag = harness.coordinator.get_diagnostic_data()
 
-        expected_keys = {
-            "current_state",
-            "timers",
-            "lights_on",
-            "total_lights",
-            "motion_active",
-            "event_log",
-            "last_event_message",
-            "last_transition_reason",
-        }
-        missing = expected_keys - set(diag.keys())
+        missing = _ESSENTIAL_DIAGNOSTIC_KEYS - diag.keys()
         assert not missing, f"Missing diagnostic keys: {missing}"
 
     async def test_diagnostic_data_reflects_current_state(
@@ -7,7 +7,9 @@ is complete and correct.
 
 from __future__ import annotations
 
-import time
+from datetime import timedelta
+
+from freezegun.api import FrozenDateTimeFactory
 
 from custom_components.motion_lights_automation.state_machine import (
     STATE_AUTO,
@@ -518,10 +520,12 @@ class TestEdgeCases:
 
         assert fired == [], "force_state must not fire any callbacks"
 
-    def test_time_in_current_state_increases(self) -> None:
+    def test_time_in_current_state_increases(
+        self, freezer: FrozenDateTimeFactory
+    ) -> None:
         sm = MotionLightsStateMachine()
         t0 = sm.time_in_current_state
-        time.sleep(0.02)
+        freezer.tick(timedelta(seconds=1))
         t1 = sm.time_in_current_state
         assert t1 > t0
 
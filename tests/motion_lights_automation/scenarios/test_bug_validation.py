@@ -424,18 +424,17 @@ class TestBug4_RedundantCondition:
             "Redundant condition pattern should be simplified"
         )
 
-    def test_conditions_are_logically_equivalent(self) -> None:
+    @pytest.mark.parametrize("old_state_val", ["on", "off", "unavailable"])
+    @pytest.mark.parametrize("new_state_val", ["on", "off", "unavailable"])
+    def test_conditions_are_logically_equivalent(
+        self, new_state_val: str, old_state_val: str
+    ) -> None:
         """Prove the two conditions are equivalent for all input combinations."""
-        for new_state_val in ["on", "off", "unavailable"]:
-            for old_state_val in ["on", "off", "unavailable"]:
-                # Original condition
-                original = new_state_val == "on" or (
-                    new_state_val == "on" and old_state_val == "on"
-                )
-                # Simplified condition
-                simplified = new_state_val == "on"
+        # Original condition
+        original = new_state_val == "on" or (
+            new_state_val == "on" and old_state_val == "on"
+        )
+        # Simplified condition
+        simplified = new_state_val == "on"
 
-                assert original == simplified, (
-                    f"Conditions differ for new={new_state_val}, old={old_state_val}: "
-                    f"original={original}, simplified={simplified}"
-                )
+        assert original == simplified, f"original={original}, simplified={simplified}"
@@ -1,5 +1,8 @@
 """Tests for critical bug fixes identified in deep research."""
 
+import asyncio
+from types import MappingProxyType
+
 import pytest
 from unittest.mock import patch
 
@@ -10,7 +13,6 @@ from custom_components.motion_lights_automation.const import (
     CONF_MOTION_DELAY,
     CONF_MOTION_ENTITY,
     CONF_LIGHTS,
-    DOMAIN,
 )
 from custom_components.motion_lights_automation.state_machine import (
     STATE_IDLE,
@@ -24,30 +26,16 @@ from custom_components.motion_lights_automation.state_machine import (
     MotionLightsStateMachine,
     StateTransitionEvent,
 )
-from custom_components.motion_lights_automation.motion_coordinator import (
-    MotionLightsCoordinator,
-)
 
 
-@pytest.fixture
-def delay_config_entry() -> ConfigEntry:
-    """Create a config entry with motion delay configured."""
-    return ConfigEntry(
-        version=1,
-        minor_version=0,
-        domain=DOMAIN,
-        title="Test Motion Delay",
-        data={
-            CONF_MOTION_ENTITY: ["binary_sensor.motion"],
-            CONF_LIGHTS: ["light.test"],
-            CONF_MOTION_DELAY: 5,  # 5 second delay
-        },
-        options={},
-        entry_id="test_delay",
-        source="user",
-        unique_id="test_delay_unique",
-        discovery_keys={},
-    )
+# Entry data for make_coordinator(); ConfigEntry is built per test by the fixture
+_DELAY_DATA = MappingProxyType(
+    {
+        CONF_LIGHTS: ("light.test",),
+        CONF_MOTION_DELAY: 5,  # 5 second delay
+    }
+)
+_BASIC_DATA = MappingProxyType({CONF_LIGHTS: ("light.test",)})
 
 
 class TestMotionDelayTimerCancellation:
@@ -55,69 +43,61 @@ class TestMotionDelayTimerCancellation:
 
     @pytest.mark.asyncio
     async def test_motion_delay_cancelled_on_motion_off(
-        self, hass: HomeAssistant, delay_config_entry: ConfigEntry
+        self, hass: HomeAssistant, make_coordinator
     ):
         """Motion delay timer should be cancelled when motion clears during delay."""
         # Set up required entities
         hass.states.async_set("binary_sensor.motion", "off")
         hass.states.async_set("light.test", "off")
 
-        coordinator = MotionLightsCoordinator(hass, delay_config_entry)
-        await coordinator.async_setup_listeners()
+        coordinator = await make_coordinator(_DELAY_DATA)
 
-        try:
-            # Start in IDLE state
-            assert coordinator.state_machine.current_state == STATE_IDLE
+        # Start in IDLE state
+        assert coordinator.state_machine.current_state == STATE_IDLE
 
-            # Simulate motion on - should start delay timer
-            coordinator._handle_motion_on()
+        # Simulate motion on - should start delay timer
+        coordinator._handle_motion_on()
 
-            # Verify delay timer was started
-            assert coordinator.timer_manager.has_active_timer("motion_delay")
+        # Verify delay timer was started
+        assert coordinator.timer_manager.has_active_timer("motion_delay")
 
-            # Motion clears during delay
-            coordinator._handle_motion_off()
+        # Motion clears during delay
+        coordinator._handle_motion_off()
 
-            # Verify delay timer was cancelled
-            assert not coordinator.timer_manager.has_active_timer("motion_delay")
+        # Verify delay timer was cancelled
+        assert not coordinator.timer_manager.has_active_timer("motion_delay")
 
-            # State should still be IDLE (didn't transition)
-            assert coordinator.state_machine.current_state == STATE_IDLE
-        finally:
-            coordinator.async_cleanup_listeners()
+        # State should still be IDLE (didn't transition)
+        assert coordinator.state_machine.current_state == STATE_IDLE
 
     @pytest.mark.asyncio
     async def test_motion_delay_cancelled_on_override(
-        self, hass: HomeAssistant, delay_config_entry: ConfigEntry
+        self, hass: HomeAssistant, make_coordinator
     ):
         """Motion delay timer should be cancelled when override activates."""
         # Set up required entities
         hass.states.async_set("binary_sensor.motion", "off")
         hass.states.async_set("light.test", "off")
 
-        coordinator = MotionLightsCoordinator(hass, delay_config_entry)
-        await coordinator.async_setup_listeners()
+        coordinator = await make_coordinator(_DELAY_DATA)
 
-        try:
-            # Start in IDLE state
-            assert coordinator.state_machine.current_state == STATE_IDLE
+        # Start in IDLE state
+        assert coordinator.state_machine.current_state == STATE_IDLE
 
-            # Simulate motion on - should start delay timer
-            coordinator._handle_motion_on()
+        # Simulate motion on - should start delay timer
+        coordinator._handle_motion_on()
 
-            # Verify delay timer was started
-            assert coordinator.timer_manager.has_active_timer("motion_delay")
+        # Verify delay timer was started
+        assert coordinator.timer_manager.has_active_timer("motion_delay")
 
-            # Override activates during delay
-            coordinator._handle_override_on()
+        # Override activates during delay
+        coordinator._handle_override_on()
 
-            # Verify delay timer was cancelled
-            assert not coordinator.timer_manager.has_active_timer("motion_delay")
+        # Verify delay timer was cancelled
+        assert not coordinator.timer_manager.has_active_timer("motion_delay")
 
-            # State should be OVERRIDDEN
-            assert coordinator.state_machine.current_state == STATE_OVERRIDDEN
-        finally:
-            coordinator.async_cleanup_listeners()
+        # State should be OVERRIDDEN
+        assert coordinator.state_machine.current_state == STATE_OVERRIDDEN
 
 
 class TestLightsAllOffFromManual:
@@ -153,143 +133,41 @@ class TestLightsAllOffFromManual:
         assert sm.current_state == STATE_IDLE
 
 
-@pytest.fixture
-def basic_config_entry() -> ConfigEntry:
-    """Create a basic config entry."""
-    return ConfigEntry(
-        version=1,
-        minor_version=0,
-        domain=DOMAIN,
-        title="Test Basic",
-        data={
-            CONF_MOTION_ENTITY: ["binary_sensor.motion"],
-            CONF_LIGHTS: ["light.test"],
-        },
-        options={},
-        entry_id="test_basic",
-        source="user",
-        unique_id="test_basic_unique",
-        discovery_keys={},
-    )
-
-
 class TestTimerRaceCondition:
     """Test timer callback state validation prevents race conditions."""
 
     @pytest.mark.asyncio
-    async def test_timer_callback_ignored_in_overridden_state(
-        self, hass: HomeAssistant, basic_config_entry: ConfigEntry
-    ):
-        """Timer expiring in OVERRIDDEN state should not transition to IDLE."""
-        hass.states.async_set("binary_sensor.motion", "off")
-        hass.states.async_set("light.test", "off")
-
-        coordinator = MotionLightsCoordinator(hass, basic_config_entry)
-        await coordinator.async_setup_listeners()
-
-        try:
-            # Force to OVERRIDDEN state (simulating override activated)
-            coordinator.state_machine.force_state(STATE_OVERRIDDEN)
-
-            # Simulate timer callback firing (as if scheduled before override)
-            await coordinator._async_timer_expired("motion")
-
-            # Should still be OVERRIDDEN - timer was ignored
-            assert coordinator.state_machine.current_state == STATE_OVERRIDDEN
-        finally:
-            coordinator.async_cleanup_listeners()
-
-    @pytest.mark.asyncio
-    async def test_timer_callback_ignored_in_motion_auto_state(
-        self, hass: HomeAssistant, basic_config_entry: ConfigEntry
-    ):
-        """Timer expiring in MOTION_AUTO state should not transition to IDLE."""
-        hass.states.async_set("binary_sensor.motion", "off")
-        hass.states.async_set("light.test", "off")
-
-        coordinator = MotionLightsCoordinator(hass, basic_config_entry)
-        await coordinator.async_setup_listeners()
-
-        try:
-            # Force to MOTION_AUTO state
-            coordinator.state_machine.force_state(STATE_MOTION_AUTO)
-
-            # Simulate timer callback firing
-            await coordinator._async_timer_expired("motion")
-
-            # Should still be MOTION_AUTO - timer was ignored
-            assert coordinator.state_machine.current_state == STATE_MOTION_AUTO
-        finally:
-            coordinator.async_cleanup_listeners()
-
-    @pytest.mark.asyncio
-    async def test_timer_callback_works_in_auto_state(
-        self, hass: HomeAssistant, basic_config_entry: ConfigEntry
-    ):
-        """Timer expiring in AUTO state should transition to IDLE."""
-        hass.states.async_set("binary_sensor.motion", "off")
-        hass.states.async_set("light.test", "off")
-
-        coordinator = MotionLightsCoordinator(hass, basic_config_entry)
-        await coordinator.async_setup_listeners()
-
-        try:
-            # Force to AUTO state
-            coordinator.state_machine.force_state(STATE_AUTO)
-
-            # Simulate timer callback firing
-            await coordinator._async_timer_expired("motion")
-
-            # Should transition to IDLE
-            assert coordinator.state_machine.current_state == STATE_IDLE
-        finally:
-            coordinator.async_cleanup_listeners()
-
-    @pytest.mark.asyncio
-    async def test_timer_callback_works_in_manual_state(
-        self, hass: HomeAssistant, basic_config_entry: ConfigEntry
-    ):
-        """Timer expiring in MANUAL state should transition to IDLE."""
-        hass.states.async_set("binary_sensor.motion", "off")
-        hass.states.async_set("light.test", "off")
-
-        coordinator = MotionLightsCoordinator(hass, basic_config_entry)
-        await coordinator.async_setup_listeners()
-
-        try:
-            # Force to MANUAL state
-            coordinator.state_machine.force_state(STATE_MANUAL)
-
-            # Simulate timer callback firing
-            await coordinator._async_timer_expired("extended")
-
-            # Should transition to IDLE
-            assert coordinator.state_machine.current_state == STATE_IDLE
-        finally:
-            coordinator.async_cleanup_listeners()
-
-    @pytest.mark.asyncio
-    async def test_timer_callback_works_in_manual_off_state(
-        self, hass: HomeAssistant, basic_config_entry: ConfigEntry
+    @pytest.mark.parametrize(
+        ("forced_state", "timer_name", "expected_state"),
+        [
+            # Timer scheduled before an override/motion must be ignored
+            (STATE_OVERRIDDEN, "motion", STATE_OVERRIDDEN),
+            (STATE_MOTION_AUTO, "motion", STATE_MOTION_AUTO),
+            # Timer expiring in a lights-on state goes to IDLE
+            (STATE_AUTO, "motion", STATE_IDLE),
+            (STATE_MANUAL, "extended", STATE_IDLE),
+            (STATE_MANUAL_OFF, "extended", STATE_IDLE),
+        ],
+    )
+    async def test_timer_callback_state_matrix(
+        self,
+        hass: HomeAssistant,
+        make_coordinator,
+        forced_state: str,
+        timer_name: str,
+        expected_state: str,
     ):
-        """Timer expiring in MANUAL_OFF state should transition to IDLE."""
+        """Timer expiry only transitions to IDLE from states it applies to."""
         hass.states.async_set("binary_sensor.motion", "off")
         hass.states.async_set("light.test", "off")
 
-        coordinator = MotionLightsCoordinator(hass, basic_config_entry)
-        await coordinator.async_setup_listeners()
-
-        try:
-            # Force to MANUAL_OFF state
-            coordinator.state_machine.force_state(STATE_MANUAL_OFF)
+        coordinator = await make_coordinator(_BASIC_DATA)
 
-            # Simulate timer callback firing
-            await coordinator._async_timer_expired("extended")
+        # Simulate the timer callback firing after the state was changed
+        coordinator.state_machine.force_state(forced_state)
+        await coordinator._async_timer_expired(timer_name)
 
-            # Should transition to IDLE
-            assert coordinator.state_machine.current_state == STATE_IDLE
-        finally:
-            coordinator.async_cleanup_listeners()
+        assert coordinator.state_machine.current_state == expected_state
 
 
 class TestTimerCallbackPassesName:
@@ -305,22 +183,16 @@ class TestTimerCallbackPassesName:
 
         manager = TimerManager(hass)
         received_name = None
+        fired = asyncio.Event()
 
         async def callback(timer_id: str = None):
             nonlocal received_name
             received_name = timer_id
+            fired.set()
 
-        # Start a timer with very short duration
+        # Start a timer with zero duration and wait for its callback
         manager.start_timer("test_timer", TimerType.MOTION, callback, duration=0)
-
-        # Wait for timer to fire
-        await hass.async_block_till_done()
-
-        # Give a bit more time for the callback to execute
-        import asyncio
-
-        await asyncio.sleep(0.1)
-        await hass.async_block_till_done()
+        await asyncio.wait_for(fired.wait(), timeout=1.0)
 
         # Verify callback received the timer name
         assert received_name == "test_timer"
@@ -37,3 +37,19 @@ class TestIntegrationSetup:
         await hass.async_block_till_done()
 
         assert mock_config_entry.state == ConfigEntryState.LOADED
+
+    async def test_async_unload_entry_cleans_up_listeners(
+        self, hass: HomeAssistant, mock_config_entry
+    ):
+        """Test that unloading the entry tears down the coordinator."""
+        await hass.config_entries.async_add(mock_config_entry)
+        await hass.async_block_till_done()
+        coordinator = mock_config_entry.runtime_data
+        assert coordinator._cleanup_handle is not None
+
+        assert await hass.config_entries.async_unload(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        assert mock_config_entry.state == ConfigEntryState.NOT_LOADED
+        assert coordinator._cleanup_handle is None
+        assert coordinator._reconciliation_handle is None
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
-
-from homeassistant.core import HomeAssistant, ServiceCall
+import pytest
+from homeassistant.core import HomeAssistant, ServiceCall, State
+from homeassistant.util.read_only_dict import ReadOnlyDict
+from pytest_homeassistant_custom_component.common import async_mock_service
 
 from custom_components.motion_lights_automation.light_controller import (
     BrightnessStrategy,
@@ -13,19 +14,35 @@ from custom_components.motion_lights_automation.light_controller import (
     TimeOfDayBrightnessStrategy,
 )
 
+# More context IDs than cleanup_old_contexts() keeps
+_CONTEXT_IDS = tuple(f"context_{i}" for i in range(150))
+
+# Shared 50% light attributes
+_BRIGHTNESS_128 = ReadOnlyDict({"brightness": 128})
+
+
+@pytest.fixture(scope="module")
+def strategy_60_10():
+    """Return the shared 60%/10% time-of-day brightness strategy."""
+    return TimeOfDayBrightnessStrategy(active_brightness=60, inactive_brightness=10)
+
+
+@pytest.fixture
+def controller(hass: HomeAssistant) -> LightController:
+    """Return a controller for the three lights most tests use."""
+    return LightController(hass, ["light.c1", "light.c2", "light.bg"])
 
-def async_mock_service(
-    hass: HomeAssistant, domain: str, service: str
-) -> list[ServiceCall]:
-    """Mock a service and return a list to track calls."""
-    calls = []
 
-    async def mock_service_handler(call: ServiceCall) -> None:
-        """Handle service calls."""
-        calls.append(call)
+@pytest.fixture
+def light_turn_on_calls(hass: HomeAssistant) -> list[ServiceCall]:
+    """Register a mock light.turn_on service and return its call log."""
+    return async_mock_service(hass, "light", "turn_on")
 
-    hass.services.async_register(domain, service, mock_service_handler)
-    return calls
+
+@pytest.fixture
+def light_turn_off_calls(hass: HomeAssistant) -> list[ServiceCall]:
+    """Register a mock light.turn_off service and return its call log."""
+    return async_mock_service(hass, "light", "turn_off")
 
 
 class TestLightState:
@@ -38,45 +55,39 @@ class TestLightState:
         assert state.is_on is True
         assert state.brightness_pct == 50
 
-    def test_light_state_from_ha_state_on(self):
-        """Test LightState from HA state (on)."""
-        ha_state = MagicMock()
-        ha_state.state = "on"
-        ha_state.attributes = {"brightness": 128}
-
-        light_state = LightState.from_ha_state("light.test", ha_state)
-        assert light_state.is_on is True
-        assert light_state.brightness_pct == 50  # 128/255 * 100
-
-    def test_light_state_from_ha_state_off(self):
-        """Test LightState from HA state (off)."""
-        ha_state = MagicMock()
-        ha_state.state = "off"
-        ha_state.attributes = {}
+    @pytest.mark.parametrize(
+        ("state", "attributes", "expected_on", "expected_pct"),
+        [
+            ("on", _BRIGHTNESS_128, True, 50),  # 128/255 * 100
+            ("off", {}, False, 0),
+        ],
+        ids=["on", "off"],
+    )
+    def test_light_state_from_ha_state(
+        self, state: str, attributes: dict, expected_on: bool, expected_pct: int
+    ):
+        """Test LightState from HA state."""
+        ha_state = State("light.test", state, attributes)
 
         light_state = LightState.from_ha_state("light.test", ha_state)
-        assert light_state.is_on is False
-        assert light_state.brightness_pct == 0
+        assert light_state.is_on is expected_on
+        assert light_state.brightness_pct == expected_pct
 
 
 class TestBrightnessStrategy:
     """Test brightness strategies."""
 
-    def test_time_of_day_strategy_day(self):
-        """Test TimeOfDayBrightnessStrategy for active house and light outside mode."""
-        strategy = TimeOfDayBrightnessStrategy(
-            active_brightness=60, inactive_brightness=10
-        )
-        brightness = strategy.get_brightness({"is_house_active": True})
-        assert brightness == 60
-
-    def test_time_of_day_strategy_night(self):
-        """Test TimeOfDayBrightnessStrategy for inactive mode."""
-        strategy = TimeOfDayBrightnessStrategy(
-            active_brightness=60, inactive_brightness=10
-        )
-        brightness = strategy.get_brightness({"is_house_active": False})
-        assert brightness == 10
+    @pytest.mark.parametrize(
+        ("is_house_active", "expected"),
+        [(True, 60), (False, 10)],
+        ids=["active", "inactive"],
+    )
+    def test_time_of_day_strategy(
+        self, strategy_60_10, is_house_active: bool, expected: int
+    ):
+        """Test TimeOfDayBrightnessStrategy picks brightness by house activity."""
+        brightness = strategy_60_10.get_brightness({"is_house_active": is_house_active})
+        assert brightness == expected
 
     def test_custom_brightness_strategy(self):
         """Test custom brightness strategy."""
@@ -99,11 +110,8 @@ class TestLightController:
         controller = LightController(hass, lights)
         assert controller is not None
 
-    def test_get_all_lights(self, hass: HomeAssistant):
+    def test_get_all_lights(self, hass: HomeAssistant, controller: LightController):
         """Test get_all_lights method."""
-        lights = ["light.c1", "light.c2", "light.bg"]
-        controller = LightController(hass, lights)
-
         all_lights = controller.get_all_lights()
         assert "light.c1" in all_lights
         assert "light.c2" in all_lights
@@ -121,11 +129,9 @@ class TestLightController:
 
     def test_update_light_state(self, hass: HomeAssistant):
         """Test update_light_state method."""
-        controller = LightController(hass, {})
+        controller = LightController(hass, [])
 
-        ha_state = MagicMock()
-        ha_state.state = "on"
-        ha_state.attributes = {"brightness": 128}
+        ha_state = State("light.test", "on", _BRIGHTNESS_128)
 
         light_state = controller.update_light_state("light.test", ha_state)
         assert light_state.is_on is True
@@ -133,11 +139,9 @@ class TestLightController:
 
     def test_get_light_state(self, hass: HomeAssistant):
         """Test get_light_state method."""
-        controller = LightController(hass, {})
+        controller = LightController(hass, [])
 
-        ha_state = MagicMock()
-        ha_state.state = "on"
-        ha_state.attributes = {"brightness": 128}
+        ha_state = State("light.test", "on", _BRIGHTNESS_128)
 
         controller.update_light_state("light.test", ha_state)
         light_state = controller.get_light_state("light.test")
@@ -147,22 +151,19 @@ class TestLightController:
 
     def test_any_lights_on(self, hass: HomeAssistant):
         """Test any_lights_on method."""
-        controller = LightController(hass, {})
+        controller = LightController(hass, [])
 
         # No lights tracked yet
         assert controller.any_lights_on() is False
 
         # Add an off light
-        ha_state = MagicMock()
-        ha_state.state = "off"
-        ha_state.attributes = {}
-        controller.update_light_state("light.off", ha_state)
+        controller.update_light_state("light.off", State("light.off", "off"))
         assert controller.any_lights_on() is False
 
         # Add an on light
-        ha_state.state = "on"
-        ha_state.attributes = {"brightness": 100}
-        controller.update_light_state("light.on", ha_state)
+        controller.update_light_state(
+            "light.on", State("light.on", "on", {"brightness": 100})
+        )
         assert controller.any_lights_on() is True
 
     def test_any_lights_on_with_refresh_false(self, hass: HomeAssistant):
@@ -171,7 +172,7 @@ class TestLightController:
         controller = LightController(hass, lights)
 
         # Set initial state in Home Assistant and populate cache
-        hass.states.async_set("light.c1", "on", {"brightness": 128})
+        hass.states.async_set("light.c1", "on", _BRIGHTNESS_128)
         controller.refresh_all_states()
         assert controller.any_lights_on() is True
 
@@ -187,7 +188,7 @@ class TestLightController:
         controller = LightController(hass, lights)
 
         # Set initial state in Home Assistant and populate cache
-        hass.states.async_set("light.c1", "on", {"brightness": 128})
+        hass.states.async_set("light.c1", "on", _BRIGHTNESS_128)
         controller.refresh_all_states()
         assert controller.any_lights_on() is True
 
@@ -197,18 +198,10 @@ class TestLightController:
         # With refresh=True, should get current state from Home Assistant (off)
         assert controller.any_lights_on(refresh=True) is False
 
-    def test_refresh_all_states(self, hass: HomeAssistant):
+    def test_refresh_all_states(self, hass: HomeAssistant, controller: LightController):
         """Test refresh_all_states method."""
-        lights = ["light.c1", "light.c2", "light.bg"]
-        controller = LightController(hass, lights)
-
-        # Mock states directly
-        mock_state = MagicMock()
-        mock_state.state = "on"
-        mock_state.attributes = {"brightness": 128}
-
-        hass.states.async_set("light.c1", "on", {"brightness": 128})
-        hass.states.async_set("light.c2", "on", {"brightness": 128})
+        hass.states.async_set("light.c1", "on", _BRIGHTNESS_128)
+        hass.states.async_set("light.c2", "on", _BRIGHTNESS_128)
 
         controller.refresh_all_states()
 
@@ -216,78 +209,72 @@ class TestLightController:
         assert controller.get_light_state("light.c1") is not None
         assert controller.get_light_state("light.c2") is not None
 
-    async def test_turn_on_auto_lights(self, hass: HomeAssistant):
-        """Test turn_on_auto_lights method."""
-        lights = ["light.c1", "light.c2", "light.bg"]
+    @pytest.mark.parametrize(
+        ("lights", "state", "attributes", "expected_on"),
+        [
+            (["light.c1", "light.c2", "light.bg"], "off", {}, ["light.c1"]),
+            # Already on at default brightness (204 = 80%), within 5%
+            (["light.c1"], "on", {"brightness": 204}, []),
+        ],
+        ids=["turns_on", "skips_already_on"],
+    )
+    async def test_turn_on_auto_lights(
+        self,
+        hass: HomeAssistant,
+        light_turn_on_calls: list[ServiceCall],
+        lights: list[str],
+        state: str,
+        attributes: dict,
+        expected_on: list[str],
+    ):
+        """Test turn_on_auto_lights turns on off lights and skips lit ones."""
         controller = LightController(hass, lights)
 
-        # Set state in hass
-        hass.states.async_set("light.c1", "off", {})
-
-        # Mock the light service
-        calls = async_mock_service(hass, "light", "turn_on")
-
-        turned_on = await controller.turn_on_auto_lights({"is_night": False})
-
-        assert "light.c1" in turned_on
-        assert len(calls) == 1
-        assert calls[0].domain == "light"
-        assert calls[0].service == "turn_on"
-
-    async def test_turn_on_auto_lights_skips_already_on(self, hass: HomeAssistant):
-        """Test turn_on_auto_lights skips lights at correct brightness."""
-        lights = ["light.c1"]
-        controller = LightController(hass, lights)
-
-        # Set light already on at default brightness (204 = 80%)
-        hass.states.async_set("light.c1", "on", {"brightness": 204})
-
-        # Mock the light service
-        calls = async_mock_service(hass, "light", "turn_on")
+        hass.states.async_set("light.c1", state, attributes)
 
         turned_on = await controller.turn_on_auto_lights({"is_house_active": True})
 
-        # Should not turn on lights already at correct brightness (within 5%)
-        assert len(turned_on) == 0
-        assert len(calls) == 0
-
-    async def test_turn_off_lights(self, hass: HomeAssistant):
+        assert list(turned_on) == expected_on
+        assert len(light_turn_on_calls) == len(expected_on)
+        for call in light_turn_on_calls:
+            assert call.domain == "light"
+            assert call.service == "turn_on"
+
+    async def test_turn_off_lights(
+        self,
+        hass: HomeAssistant,
+        controller: LightController,
+        light_turn_off_calls: list[ServiceCall],
+    ):
         """Test turn_off_lights method."""
-        lights = ["light.c1", "light.c2", "light.bg"]
-        controller = LightController(hass, lights)
-
         # Set light on
-        hass.states.async_set("light.c1", "on", {"brightness": 128})
-
-        # Mock the light service
-        calls = async_mock_service(hass, "light", "turn_off")
+        hass.states.async_set("light.c1", "on", _BRIGHTNESS_128)
 
         turned_off = await controller.turn_off_lights()
 
         assert "light.c1" in turned_off
-        assert len(calls) == 1
-        assert calls[0].domain == "light"
-        assert calls[0].service == "turn_off"
-
-    async def test_turn_off_lights_skips_already_off(self, hass: HomeAssistant):
+        assert len(light_turn_off_calls) == 1
+        assert light_turn_off_calls[0].domain == "light"
+        assert light_turn_off_calls[0].service == "turn_off"
+
+    async def test_turn_off_lights_skips_already_off(
+        self,
+        hass: HomeAssistant,
+        controller: LightController,
+        light_turn_off_calls: list[ServiceCall],
+    ):
         """Test turn_off_lights skips already-off lights."""
-        lights = ["light.c1", "light.c2", "light.bg"]
-        controller = LightController(hass, lights)
-
         # Set light already off
         hass.states.async_set("light.c1", "off", {})
 
-        # Mock the light service
-        calls = async_mock_service(hass, "light", "turn_off")
-
         turned_off = await controller.turn_off_lights()
 
         assert len(turned_off) == 0
-        assert len(calls) == 0
+        assert len(light_turn_off_calls) == 0
 
     def test_set_brightness_strategy(self, hass: HomeAssistant):
         """Test set_brightness_strategy method."""
-        controller = LightController(hass, {})
+        controller = LightController(hass, [])
 
         new_strategy = TimeOfDayBrightnessStrategy(
             active_brightness=80, inactive_brightness=20
@@ -296,11 +283,8 @@ class TestLightController:
 
         assert controller._brightness_strategy == new_strategy
 
-    def test_get_info(self, hass: HomeAssistant):
+    def test_get_info(self, hass: HomeAssistant, controller: LightController):
         """Test get_info method."""
-        lights = ["light.c1", "light.c2", "light.bg"]
-        controller = LightController(hass, lights)
-
         info = controller.get_info()
         assert "lights" in info
         assert "total_lights" in info
@@ -312,8 +296,7 @@ class TestLightController:
         controller = LightController(hass, [])
 
         # Add many contexts
-        for i in range(150):
-            controller._context_tracking.add(f"context_{i}")
+        controller._context_tracking.update(_CONTEXT_IDS)
 
         assert len(controller._context_tracking) == 150
 
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+import time
 
 import pytest
-from homeassistant.core import Context
+from homeassistant.core import Context, State
 
 from custom_components.motion_lights_automation.manual_detection import (
     BrightnessThresholdStrategy,
@@ -15,103 +15,89 @@ from custom_components.motion_lights_automation.manual_detection import (
     TimeWindowStrategy,
 )
 
+# Default-threshold strategy; it keeps no per-call state, so tests share it
+_DEFAULT_BRIGHTNESS_STRATEGY = BrightnessThresholdStrategy()
 
-class TestBrightnessThresholdStrategy:
-    """Test BrightnessThresholdStrategy class."""
-
-    def test_light_turned_on_manually(self):
-        """Test detection when light turned on."""
-        strategy = BrightnessThresholdStrategy()
+# Off -> on at 50%: the default strategy reports this as manual
+_OFF_STATE = State("light.test", "off")
+_ON_128_STATE = State("light.test", "on", {"brightness": 128})
 
-        old_state = MagicMock()
-        old_state.state = "off"
-        old_state.attributes = {}
 
-        new_state = MagicMock()
-        new_state.state = "on"
-        new_state.attributes = {"brightness": 128}
-
-        is_manual, reason = strategy.is_manual_intervention(
-            "light.test", old_state, new_state, None
-        )
+# Context the integration created itself; strategies must ignore its changes
+_INTEGRATION_CONTEXT = Context(id="test_context_123")
+_INTEGRATION_CONTEXT_IDS = frozenset({_INTEGRATION_CONTEXT.id})
 
-        assert is_manual is True
-        assert "turned on manually" in reason
 
-    def test_light_turned_off_manually(self):
-        """Test detection when light turned off."""
-        strategy = BrightnessThresholdStrategy()
+class _AlwaysFalse(ManualInterventionStrategy):
+    """Strategy that never reports a manual intervention."""
 
-        old_state = MagicMock()
-        old_state.state = "on"
-        old_state.attributes = {"brightness": 128}
+    def is_manual_intervention(self, entity_id, old_state, new_state, context):
+        return False, None
 
-        new_state = MagicMock()
-        new_state.state = "off"
-        new_state.attributes = {}
 
-        is_manual, reason = strategy.is_manual_intervention(
-            "light.test", old_state, new_state, None
-        )
-
-        assert is_manual is True
-        assert "turned off manually" in reason
-
-    def test_brightness_change_above_threshold(self):
-        """Test detection when brightness changes significantly."""
-        strategy = BrightnessThresholdStrategy(brightness_threshold_pct=10)
-
-        old_state = MagicMock()
-        old_state.state = "on"
-        old_state.attributes = {"brightness": 51}  # 20%
-
-        new_state = MagicMock()
-        new_state.state = "on"
-        new_state.attributes = {"brightness": 153}  # 60%
-
-        is_manual, reason = strategy.is_manual_intervention(
-            "light.test", old_state, new_state, None
-        )
-
-        assert is_manual is True
-        assert "brightness changed manually" in reason
-
-    def test_brightness_change_below_threshold(self):
-        """Test no detection when brightness change is small."""
-        strategy = BrightnessThresholdStrategy(brightness_threshold_pct=10)
-
-        old_state = MagicMock()
-        old_state.state = "on"
-        old_state.attributes = {"brightness": 128}  # 50%
-
-        new_state = MagicMock()
-        new_state.state = "on"
-        new_state.attributes = {"brightness": 133}  # 52%
+class TestBrightnessThresholdStrategy:
+    """Test BrightnessThresholdStrategy class."""
 
-        is_manual, reason = strategy.is_manual_intervention(
+    @pytest.fixture(scope="class")
+    def strategy_10pct(self) -> BrightnessThresholdStrategy:
+        """Return one stateless 10% threshold strategy for the class."""
+        return BrightnessThresholdStrategy(brightness_threshold_pct=10)
+
+    @pytest.mark.parametrize(
+        ("old", "new", "expect_manual", "reason_fragment"),
+        [
+            (("off", {}), ("on", {"brightness": 128}), True, "turned on manually"),
+            (("on", {"brightness": 128}), ("off", {}), True, "turned off manually"),
+            # 20% -> 60%
+            (
+                ("on", {"brightness": 51}),
+                ("on", {"brightness": 153}),
+                True,
+                "brightness changed manually",
+            ),
+            # 50% -> 52%
+            (("on", {"brightness": 128}), ("on", {"brightness": 133}), False, None),
+        ],
+        ids=[
+            "turned_on",
+            "turned_off",
+            "brightness_above_threshold",
+            "brightness_below_threshold",
+        ],
+    )
+    def test_state_change_detection(
+        self,
+        strategy_10pct: BrightnessThresholdStrategy,
+        old: tuple[str, dict],
+        new: tuple[str, dict],
+        expect_manual: bool,
+        reason_fragment: str | None,
+    ):
+        """Test detection of on/off and brightness changes against a 10% threshold."""
+        old_state = State("light.test", *old)
+        new_state = State("light.test", *new)
+
+        is_manual, reason = strategy_10pct.is_manual_intervention(
             "light.test", old_state, new_state, None
         )
 
-        assert is_manual is False
-        assert reason is None
+        assert is_manual is expect_manual
+        if reason_fragment is None:
+            assert reason is None
+        else:
+            assert reason_fragment in reason
 
     def test_integration_context_ignored(self):
         """Test that integration contexts are ignored."""
-        context_id = "test_context_123"
-        strategy = BrightnessThresholdStrategy(integration_contexts={context_id})
-
-        old_state = MagicMock()
-        old_state.state = "off"
-
-        new_state = MagicMock()
-        new_state.state = "on"
-        new_state.attributes = {"brightness": 128}
+        strategy = BrightnessThresholdStrategy(
+            integration_contexts=_INTEGRATION_CONTEXT_IDS
+        )
 
-        context = Context()
-        context.id = context_id
+        old_state = State("light.test", "off")
+        new_state = State("light.test", "on", {"brightness": 128})
 
         is_manual, reason = strategy.is_manual_intervention(
-            "light.test", old_state, new_state, context
+            "light.test", old_state, new_state, _INTEGRATION_CONTEXT
         )
 
         assert is_manual is False
@@ -126,11 +112,8 @@ class TestTimeWindowStrategy:
         strategy = TimeWindowStrategy(window_seconds=5.0)
         strategy.mark_automation_action()
 
-        old_state = MagicMock()
-        old_state.state = "off"
-
-        new_state = MagicMock()
-        new_state.state = "on"
+        old_state = State("light.test", "off")
+        new_state = State("light.test", "on")
 
         is_manual, reason = strategy.is_manual_intervention(
             "light.test", old_state, new_state, None
@@ -139,21 +122,19 @@ class TestTimeWindowStrategy:
         assert is_manual is False
         assert reason is None
 
-    def test_change_outside_window_detected(self):
+    def test_change_outside_window_detected(self, monkeypatch: pytest.MonkeyPatch):
         """Test that changes outside time window are detected."""
-        import time
+        now = [1000.0]
+        monkeypatch.setattr(time, "monotonic", lambda: now[0])
 
-        strategy = TimeWindowStrategy(window_seconds=0.1)
+        strategy = TimeWindowStrategy(window_seconds=5.0)
         strategy.mark_automation_action()
 
-        # Wait for window to expire
-        time.sleep(0.2)
-
-        old_state = MagicMock()
-        old_state.state = "off"
+        # Step the clock past the window instead of sleeping
+        now[0] += strategy.window_seconds + 1.0
 
-        new_state = MagicMock()
-        new_state.state = "on"
+        old_state = State("light.test", "off")
+        new_state = State("light.test", "on")
 
         is_manual, reason = strategy.is_manual_intervention(
             "light.test", old_state, new_state, None
@@ -164,20 +145,13 @@ class TestTimeWindowStrategy:
 
     def test_integration_context_ignored(self):
         """Test that integration contexts are ignored."""
-        context_id = "test_context_123"
-        strategy = TimeWindowStrategy(integration_contexts={context_id})
+        strategy = TimeWindowStrategy(integration_contexts=_INTEGRATION_CONTEXT_IDS)
 
-        old_state = MagicMock()
-        old_state.state = "off"
-
-        new_state = MagicMock()
-        new_state.state = "on"
-
-        context = Context()
-        context.id = context_id
+        old_state = State("light.test", "off")
+        new_state = State("light.test", "on")
 
         is_manual, reason = strategy.is_manual_intervention(
-            "light.test", old_state, new_state, context
+            "light.test", old_state, new_state, _INTEGRATION_CONTEXT
         )
 
         assert is_manual is False
@@ -187,80 +161,36 @@ class TestTimeWindowStrategy:
 class TestCombinedStrategy:
     """Test CombinedStrategy class."""
 
-    def test_combined_strategy_or_logic(self):
-        """Test combined strategy with OR logic."""
-        strategy1 = BrightnessThresholdStrategy()
-        strategy2 = TimeWindowStrategy()
-
-        combined = CombinedStrategy([strategy1, strategy2], logic="OR")
-
-        old_state = MagicMock()
-        old_state.state = "off"
-
-        new_state = MagicMock()
-        new_state.state = "on"
-        new_state.attributes = {"brightness": 128}
-
-        is_manual, reason = combined.is_manual_intervention(
-            "light.test", old_state, new_state, None
-        )
-
-        # Should be True because brightness strategy detects it
-        assert is_manual is True
-
-    def test_combined_strategy_and_logic(self):
-        """Test combined strategy with AND logic."""
-        strategy1 = BrightnessThresholdStrategy()
-        strategy2 = BrightnessThresholdStrategy()
-
-        combined = CombinedStrategy([strategy1, strategy2], logic="AND")
-
-        old_state = MagicMock()
-        old_state.state = "off"
-
-        new_state = MagicMock()
-        new_state.state = "on"
-        new_state.attributes = {"brightness": 128}
+    @pytest.mark.parametrize(
+        ("make_strategies", "logic", "expected"),
+        [
+            # Brightness strategy alone detects the change
+            (lambda: [_DEFAULT_BRIGHTNESS_STRATEGY, TimeWindowStrategy()], "OR", True),
+            # Both strategies detect it
+            (
+                lambda: [BrightnessThresholdStrategy(), BrightnessThresholdStrategy()],
+                "AND",
+                True,
+            ),
+            # One strategy doesn't detect it
+            (lambda: [_DEFAULT_BRIGHTNESS_STRATEGY, _AlwaysFalse()], "AND", False),
+        ],
+        ids=["or", "and", "and_one_fails"],
+    )
+    def test_combined_strategy_logic(self, make_strategies, logic: str, expected: bool):
+        """Test combined strategy OR/AND logic over the member results."""
+        combined = CombinedStrategy(make_strategies(), logic=logic)
 
         is_manual, reason = combined.is_manual_intervention(
-            "light.test", old_state, new_state, None
+            "light.test", _OFF_STATE, _ON_128_STATE, None
         )
 
-        # Should be True because both strategies detect it
-        assert is_manual is True
-
-    def test_combined_strategy_and_logic_one_fails(self):
-        """Test combined strategy with AND logic when one fails."""
-        # Strategy 1 will detect manual, strategy 2 won't
-        strategy1 = BrightnessThresholdStrategy()
-
-        class AlwaysFalseStrategy(ManualInterventionStrategy):
-            def is_manual_intervention(self, entity_id, old_state, new_state, context):
-                return False, None
-
-        strategy2 = AlwaysFalseStrategy()
-        combined = CombinedStrategy([strategy1, strategy2], logic="AND")
-
-        old_state = MagicMock()
-        old_state.state = "off"
-
-        new_state = MagicMock()
-        new_state.state = "on"
-        new_state.attributes = {"brightness": 128}
-
-        is_manual, reason = combined.is_manual_intervention(
-            "light.test", old_state, new_state, None
-        )
-
-        # Should be False because one strategy didn't detect it
-        assert is_manual is False
+        assert is_manual is expected
 
     def test_combined_strategy_invalid_logic(self):
         """Test that invalid logic raises ValueError."""
-        strategy1 = BrightnessThresholdStrategy()
-
         with pytest.raises(ValueError):
-            CombinedStrategy([strategy1], logic="XOR")
+            CombinedStrategy([_DEFAULT_BRIGHTNESS_STRATEGY], logic="XOR")
 
 
 class TestManualInterventionDetector:
@@ -273,36 +203,37 @@ class TestManualInterventionDetector:
 
     def test_detector_creation_custom_strategy(self):
         """Test detector creation with custom strategy."""
-        strategy = BrightnessThresholdStrategy()
+        strategy = _DEFAULT_BRIGHTNESS_STRATEGY
         detector = ManualInterventionDetector(strategy=strategy)
         assert detector._strategy == strategy
 
-    def test_check_intervention_true(self):
-        """Test check_intervention returns True for manual change."""
+    @pytest.mark.parametrize(
+        "set_strategy",
+        [False, True],
+        ids=["default_strategy", "set_strategy"],
+    )
+    def test_check_intervention_true(self, set_strategy: bool):
+        """Test check_intervention detects a manual turn-on and records why."""
         detector = ManualInterventionDetector()
+        if set_strategy:
+            # Strategies can be swapped in after construction
+            detector.set_strategy(_DEFAULT_BRIGHTNESS_STRATEGY)
 
-        old_state = MagicMock()
-        old_state.state = "off"
-
-        new_state = MagicMock()
-        new_state.state = "on"
-        new_state.attributes = {"brightness": 128}
+        result = detector.check_intervention(
+            "light.test", _OFF_STATE, _ON_128_STATE, None
+        )
 
-        result = detector.check_intervention("light.test", old_state, new_state, None)
         assert result is True
-        assert detector.get_last_reason() is not None
+        reason = detector.get_last_reason()
+        assert reason is not None
+        assert "turned on manually" in reason
 
     def test_check_intervention_false(self):
         """Test check_intervention returns False for non-manual change."""
         detector = ManualInterventionDetector()
 
-        old_state = MagicMock()
-        old_state.state = "on"
-        old_state.attributes = {"brightness": 128}
-
-        new_state = MagicMock()
-        new_state.state = "on"
-        new_state.attributes = {"brightness": 130}  # Small change
+        old_state = State("light.test", "on", {"brightness": 128})
+        new_state = State("light.test", "on", {"brightness": 130})  # Small change
 
         result = detector.check_intervention("light.test", old_state, new_state, None)
         assert result is False
@@ -316,23 +247,6 @@ class TestManualInterventionDetector:
 
         assert detector._strategy == new_strategy
 
-    def test_get_last_reason(self):
-        """Test get_last_reason method."""
-        detector = ManualInterventionDetector()
-
-        old_state = MagicMock()
-        old_state.state = "off"
-
-        new_state = MagicMock()
-        new_state.state = "on"
-        new_state.attributes = {"brightness": 128}
-
-        detector.check_intervention("light.test", old_state, new_state, None)
-
-        reason = detector.get_last_reason()
-        assert reason is not None
-        assert "turned on manually" in reason
-
     def test_get_info(self):
         """Test get_info method."""
         detector = ManualInterventionDetector()
@@ -340,22 +254,3 @@ class TestManualInterventionDetector:
         info = detector.get_info()
         assert "strategy" in info
         assert "last_manual_reason" in info
-
-    def test_add_strategy_to_detector(self):
-        """Test adding strategies to detector (for extensibility)."""
-        # This tests the pattern shown in the module
-        detector = ManualInterventionDetector()
-        brightness_strategy = BrightnessThresholdStrategy()
-
-        # The ManualInterventionDetector supports adding strategies via set_strategy
-        detector.set_strategy(brightness_strategy)
-
-        old_state = MagicMock()
-        old_state.state = "off"
-
-        new_state = MagicMock()
-        new_state.state = "on"
-        new_state.attributes = {"brightness": 128}
-
-        result = detector.check_intervention("light.test", old_state, new_state, None)
-        assert result is True
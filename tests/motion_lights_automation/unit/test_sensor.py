@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 from homeassistant.const import STATE_OFF, STATE_ON
 from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
@@ -347,3 +349,43 @@ class TestMotionLightsDiagnosticSensor:
 
         coordinator = config_entry.runtime_data
         coordinator.async_cleanup_listeners()
+
+    async def test_sensor_reads_diagnostics_once_per_update(
+        self, hass: HomeAssistant
+    ) -> None:
+        """Test state and attributes share one diagnostic snapshot per write."""
+        config_entry = MockConfigEntry(
+            domain=DOMAIN,
+            data={
+                CONF_MOTION_ENTITY: ["binary_sensor.motion"],
+                CONF_LIGHTS: ["light.test"],
+                CONF_MOTION_ACTIVATION: True,
+            },
+            entry_id="snapshot_test",
+            title="Test",
+        )
+
+        hass.states.async_set("binary_sensor.motion", STATE_OFF)
+        hass.states.async_set("light.test", STATE_OFF)
+
+        config_entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        coordinator = config_entry.runtime_data
+        with patch.object(
+            coordinator,
+            "get_diagnostic_data",
+            wraps=coordinator.get_diagnostic_data,
+        ) as spy:
+            coordinator.async_update_listeners()
+            await hass.async_block_till_done()
+
+        spy.assert_called_once()
+        sensor_state = hass.states.get("sensor.test_lighting_automation")
+        assert (
+            sensor_state.state
+            == coordinator.get_diagnostic_data()["last_event_message"]
+        )
+
+        coordinator.async_cleanup_listeners()
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
+
+from freezegun.api import FrozenDateTimeFactory
 
 from custom_components.motion_lights_automation.state_machine import (
     MotionLightsStateMachine,
@@ -411,16 +414,13 @@ class TestMotionLightsStateMachine:
         assert transitions_list[1] == (STATE_MOTION_AUTO, STATE_AUTO)
         assert transitions_list[2] == (STATE_AUTO, STATE_IDLE)
 
-    def test_state_entered_at_updates(self) -> None:
+    def test_state_entered_at_updates(self, freezer: FrozenDateTimeFactory) -> None:
         """Test state_entered_at timestamp updates on transitions."""
         sm = MotionLightsStateMachine()
 
         initial_time = sm.get_info()["state_entered_at"]
 
-        # Small delay
-        import time
-
-        time.sleep(0.01)
+        freezer.tick(timedelta(seconds=1))
 
         sm.transition(StateTransitionEvent.MOTION_ON)
         new_time = sm.get_info()["state_entered_at"]